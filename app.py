@@ -4,7 +4,7 @@ Professional Budget Tracker - Web Application
 A modern Flask-based web interface for the budget tracker.
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, Response
 from datetime import date, datetime
 import json
 import locale
@@ -13,10 +13,10 @@ import sys
 import os
 
 # Add the current directory to Python path and import the budget tracker classes
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import the classes from the main budget tracker file
-exec(open('budget-tracker.py').read())
+# Import the budget tracker classes
+from budget_tracker import BudgetTracker, Category, TransactionType, DEFAULT_PAGE_SIZE, gzip_stream
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-change-this-in-production'
@@ -40,18 +40,14 @@ def index():
     balance = tracker.get_balance()
     
     # Get recent transactions (last 10)
-    recent_transactions = sorted(tracker.transactions, key=lambda x: x.date, reverse=True)[:10]
+    recent_transactions = tracker.recent(10)
     
     # Get monthly summary for current month
     current_date = date.today()
     monthly_summary = tracker.get_monthly_summary(current_date.year, current_date.month)
     
     # Get category breakdown for expenses
-    category_totals = {}
-    for transaction in tracker.transactions:
-        if transaction.transaction_type == TransactionType.EXPENSE:
-            category = transaction.category.value
-            category_totals[category] = category_totals.get(category, 0) + transaction.amount
+    category_totals = tracker.get_category_totals(TransactionType.EXPENSE)
     
     # Sort categories by amount
     sorted_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
@@ -67,33 +63,36 @@ def index():
 
 @app.route('/transactions')
 def transactions():
-    """Transactions page."""
-    # Get filter parameters
+    """Transactions page, one page at a time (newest first)."""
+    # Get filter and paging parameters
     category_filter = request.args.get('category', '')
     type_filter = request.args.get('type', '')
+    cursor = request.args.get('cursor') or None
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
     
-    # Filter transactions
-    filtered_transactions = tracker.transactions
-    
+    category = None
     if category_filter:
         try:
             category = Category(category_filter)
-            filtered_transactions = [t for t in filtered_transactions if t.category == category]
         except ValueError:
             pass
     
+    transaction_type = None
     if type_filter:
         try:
             transaction_type = TransactionType(type_filter)
-            filtered_transactions = [t for t in filtered_transactions if t.transaction_type == transaction_type]
         except ValueError:
             pass
     
-    # Sort by date (newest first)
-    filtered_transactions = sorted(filtered_transactions, key=lambda x: x.date, reverse=True)
+    try:
+        page, next_cursor = tracker.page_transactions(cursor, limit, category, transaction_type)
+    except ValueError:
+        # Malformed cursor: fall back to the newest page
+        page, next_cursor = tracker.page_transactions(None, limit, category, transaction_type)
     
     return render_template('transactions.html',
-                         transactions=filtered_transactions,
+                         transactions=page,
+                         next_cursor=next_cursor,
                          categories=Category,
                          transaction_types=TransactionType,
                          format_currency=format_currency)
@@ -159,31 +158,12 @@ def reports():
     current_date = date.today()
     monthly_summary = tracker.get_monthly_summary(current_date.year, current_date.month)
     
-    # Get category breakdown
-    category_totals = {}
-    for transaction in tracker.transactions:
-        if transaction.transaction_type == TransactionType.EXPENSE:
-            category = transaction.category.value
-            category_totals[category] = category_totals.get(category, 0) + transaction.amount
-    
-    # Get monthly data for the last 6 months
-    monthly_data = []
-    for i in range(6):
-        month = current_date.month - i
-        year = current_date.year
-        if month <= 0:
-            month += 12
-            year -= 1
-        
-        summary = tracker.get_monthly_summary(year, month)
-        monthly_data.append({
-            'month': f"{date(year, month, 1).strftime('%B %Y')}",
-            'income': summary['income'],
-            'expenses': summary['expenses'],
-            'balance': summary['balance']
-        })
-    
-    monthly_data.reverse()  # Show oldest to newest
+    # Get category breakdown, largest first
+    category_totals = sorted(tracker.get_category_totals(TransactionType.EXPENSE).items(),
+                             key=lambda x: x[1], reverse=True)
+    
+    # Get monthly data for the last 6 months (oldest to newest)
+    monthly_data = tracker.get_monthly_trend(6, current_date)
     
     return render_template('reports.html',
                          monthly_summary=monthly_summary,
@@ -193,15 +173,18 @@ def reports():
 
 @app.route('/api/export_csv')
 def export_csv():
-    """Export data to CSV."""
-    try:
-        filename = f"budget_export_{date.today().strftime('%Y%m%d')}.csv"
-        tracker.export_to_csv(filename)
-        flash(f'Data exported to {filename}', 'success')
-    except Exception as e:
-        flash(f'Export failed: {str(e)}', 'error')
-    
-    return redirect(url_for('reports'))
+    """Stream all transactions as a CSV download (gzip-compressed with ?gzip=1)."""
+    filename = f"budget_export_{date.today().strftime('%Y%m%d')}.csv"
+    chunks = tracker.iter_csv()
+    mimetype = 'text/csv'
+    
+    if request.args.get('gzip') == '1':
+        chunks = gzip_stream(chunks)
+        filename += '.gz'
+        mimetype = 'application/gzip'
+    
+    return Response(chunks, mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename={filename}'})
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Professional Budget Tracker
+Generates synthetic ledgers and times the core operations and web routes,
+emitting machine-readable results that can be compared between commits.
+
+Usage:
+    python3 benchmark.py                          # 10k, 100k and 1M rows
+    python3 benchmark.py --sizes 10000 --output bench.json
+    python3 benchmark.py --compare old.json new.json
+    python3 benchmark.py --sizes 10000 --stress 200  # concurrent writers and readers
+    python3 benchmark.py --sizes 100000 --codecs     # compressed snapshot size and speed
+    python3 benchmark.py --sizes 10000 --crash 25    # kill writers mid-save, check no write is lost
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from budget_tracker import BinaryLedger, BudgetTracker, Category, Transaction, TransactionType, open_storage
+
+
+# Realistic names and amount ranges (in dollars) per category
+CATEGORY_PROFILES = {
+    Category.FOOD: (["Grocery Shopping", "Coffee Shop", "Restaurant Dinner", "Lunch"], 3, 180),
+    Category.TRANSPORTATION: (["Gas Station", "Bus Pass", "Parking", "Ride Share"], 2, 90),
+    Category.HOUSING: (["Rent Payment", "Home Repair"], 400, 2500),
+    Category.UTILITIES: (["Electric Bill", "Water Bill", "Internet", "Phone Bill"], 20, 200),
+    Category.ENTERTAINMENT: (["Netflix Subscription", "Movie Tickets", "Concert", "Games"], 5, 150),
+    Category.SHOPPING: (["Amazon Purchase", "Clothing", "Home Depot", "Electronics"], 10, 600),
+    Category.HEALTHCARE: (["Doctor Visit", "Pharmacy", "Gym Membership", "Dentist"], 10, 400),
+    Category.EDUCATION: (["Online Course", "Books", "Tuition"], 15, 1500),
+    Category.TRAVEL: (["Weekend Trip", "Flight", "Hotel"], 80, 2000),
+    Category.INSURANCE: (["Car Insurance", "Health Insurance", "Renters Insurance"], 30, 400),
+    Category.TAXES: (["Property Tax", "Income Tax Payment"], 100, 5000),
+    Category.OTHER_EXPENSE: (["Gift", "Donation", "Miscellaneous"], 5, 300),
+    Category.SALARY: (["Monthly Salary", "Bonus"], 2500, 9000),
+    Category.FREELANCE: (["Freelance Project", "Consulting"], 200, 3000),
+    Category.INVESTMENT: (["Investment Dividends", "Interest"], 5, 800),
+    Category.BUSINESS: (["Side Business", "Online Store Sales"], 50, 2000),
+    Category.OTHER_INCOME: (["Refund", "Cash Gift"], 10, 500),
+}
+INCOME_CATEGORIES = [Category.SALARY, Category.FREELANCE, Category.INVESTMENT,
+                     Category.BUSINESS, Category.OTHER_INCOME]
+EXPENSE_CATEGORIES = [c for c in Category if c not in INCOME_CATEGORIES]
+TAG_POOL = ["essential", "discretionary", "monthly", "weekly", "work", "family", "subscription"]
+
+# Snapshot formats and compression codecs compared by --codecs
+CODEC_FORMATS = ['.json', '.bin']
+CODEC_SUFFIXES = ['', '.gz', '.bz2', '.xz']
+
+STRESS_READ_ROUTES = ['/', '/transactions', '/api/summary', '/api/transactions', '/reports']
+WEB_ROUTES = ['/', '/transactions', '/reports', '/api/summary', '/api/categories',
+              '/api/transaction/{id}', '/api/transactions', '/api/export_csv']
+
+
+def generate_ledger(count, years=5, seed=42, end_date=None):
+    """Generate ``count`` realistic transactions spread over the last ``years`` years."""
+    rng = random.Random(seed)
+    end_date = end_date or date.today()
+    span = 365 * years
+    start_ordinal = end_date.toordinal() - span + 1
+
+    ledger = []
+    for i in range(count):
+        transaction_type = TransactionType.INCOME if rng.random() < 0.1 else TransactionType.EXPENSE
+        category = rng.choice(INCOME_CATEGORIES if transaction_type == TransactionType.INCOME
+                              else EXPENSE_CATEGORIES)
+        names, low, high = CATEGORY_PROFILES[category]
+        ledger.append(Transaction(
+            id=f"{i:08x}",
+            name=rng.choice(names),
+            amount=round(rng.uniform(low, high), 2),
+            category=category,
+            transaction_type=transaction_type,
+            date=date.fromordinal(start_ordinal + rng.randrange(span)),
+            description=None if rng.random() < 0.5 else f"Synthetic row {i}",
+            tags=rng.sample(TAG_POOL, rng.randrange(3))
+        ))
+    return ledger
+
+
+def timed(func, runs):
+    """Run ``func`` ``runs`` times and return the wall-clock durations in seconds."""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def record(results, size, backend, operation, durations, **extra):
+    """Append one measurement to the results and echo it to stderr."""
+    entry = {
+        'size': size,
+        'backend': backend,
+        'operation': operation,
+        'runs': len(durations),
+        'min_s': min(durations),
+        'median_s': statistics.median(durations),
+        'mean_s': statistics.mean(durations),
+        **extra
+    }
+    results.append(entry)
+    print(f"  {backend:<11} {operation:<32} median {entry['median_s'] * 1000:10.3f} ms "
+          f"({entry['runs']} runs)", file=sys.stderr)
+
+
+def make_tracker(path, backend):
+    """Create a tracker on ``path`` for the named backend."""
+    return BudgetTracker(path, journaled=(backend == 'journal'), partitioned=(backend == 'partitioned'))
+
+
+def data_path(workdir, size, backend):
+    """Data file (or, for partitioned storage, directory) location for a size/backend combination."""
+    suffix = {'sqlite': '.db', 'binary': '.bin', 'partitioned': ''}.get(backend, '.json')
+    return os.path.join(workdir, f"ledger_{size}_{backend}{suffix}")
+
+
+def bench_core(results, ledger, backend, workdir, repeat):
+    """Time the tracker operations for one ledger size and backend."""
+    size = len(ledger)
+    path = data_path(workdir, size, backend)
+    tracker = make_tracker(path, backend)
+    tracker.transactions = ledger
+
+    record(results, size, backend, 'save_data', timed(tracker.save_data, repeat))
+    record(results, size, backend, 'load_data', timed(lambda: make_tracker(path, backend), repeat))
+
+    # Snapshot-only backends rewrite the whole file per add, so keep the run count low there
+    adds = repeat if backend in ('json', 'binary') else max(repeat, 50)
+    record(results, size, backend, 'add_transaction', timed(
+        lambda: tracker.add_transaction("Benchmark Coffee", 4.5, Category.FOOD, TransactionType.EXPENSE,
+                                        tags=["benchmark"]), adds))
+
+    # Write-behind: adds only touch memory; one group commit persists them all
+    queued = BudgetTracker(path, journaled=(backend == 'journal'), partitioned=(backend == 'partitioned'),
+                           write_behind=True)
+    record(results, size, backend, 'add_transaction (write-behind)', timed(
+        lambda: queued.add_transaction("Benchmark Coffee", 4.5, Category.FOOD, TransactionType.EXPENSE,
+                                       tags=["benchmark"]), max(repeat, 50)))
+    record(results, size, backend, 'flush (write-behind)', timed(queued.flush, 1))
+    check_own_writes(queued, backend, 'write-behind')
+    queued.close()
+    with tracker.batch():
+        check_own_writes(tracker, backend, 'batch')
+
+    rng = random.Random(7)
+    months = sorted({(t.date.year, t.date.month) for t in ledger[:1000]})
+    record(results, size, backend, 'get_monthly_summary', timed(
+        lambda: tracker.get_monthly_summary(*rng.choice(months)), max(repeat, 100)))
+    if backend == 'binary':
+        # Aggregate straight from the memory-mapped file, without loading the ledger
+        tracker.save_data()
+        with BinaryLedger(path) as mapped:
+            record(results, size, backend, 'monthly_summary (mmap)', timed(
+                lambda: mapped.monthly_summary(*rng.choice(months)), max(repeat, 100)))
+
+    csv_path = os.path.join(workdir, f"export_{size}_{backend}.csv")
+    record(results, size, backend, 'export_to_csv', timed(lambda: tracker.export_to_csv(csv_path), repeat))
+    os.remove(csv_path)
+    return path
+
+
+def check_own_writes(tracker, backend, mode):
+    """Check that queries see a change the tracker has not written to the store yet.
+
+    The row goes into a month no generated transaction falls in and is
+    removed again afterwards.
+    """
+    day = date(2099, 12, 31)
+    added = tracker.add_transaction("Read Your Writes", 1.23, Category.EDUCATION, TransactionType.EXPENSE,
+                                    transaction_date=day)
+    failures = []
+    if added not in tracker.get_transactions_by_date_range(day, day):
+        failures.append("get_transactions_by_date_range")
+    if added not in tracker.get_transactions_by_category(Category.EDUCATION):
+        failures.append("get_transactions_by_category")
+    if tracker.get_monthly_summary(day.year, day.month)['transaction_count'] != 1:
+        failures.append("get_monthly_summary")
+    tracker.remove_transaction(added.id)
+    if failures:
+        raise AssertionError(f"{backend} ({mode}) misses its own write in {', '.join(failures)}")
+
+
+def load_web_app():
+    """Import ``web_app.py``, or return None when Flask is not installed."""
+    try:
+        import flask  # noqa: F401
+    except ImportError:
+        print("  Flask is not installed; skipping web routes", file=sys.stderr)
+        return None
+
+    import web_app
+    return web_app
+
+
+def bench_codecs(results, ledger, workdir, repeat):
+    """Time saving and loading each snapshot format with each codec, recording the file size."""
+    size = len(ledger)
+    for fmt in CODEC_FORMATS:
+        for codec in CODEC_SUFFIXES:
+            backend = (fmt + codec).lstrip('.')
+            path = os.path.join(workdir, f"ledger_{size}_codec{fmt}{codec}")
+            storage = open_storage(path)
+            save = timed(lambda: storage.save(ledger), repeat)
+            file_size = os.path.getsize(path)
+            record(results, size, backend, 'save_data', save, size_bytes=file_size)
+            record(results, size, backend, 'load_data', timed(storage.load, repeat), size_bytes=file_size)
+            print(f"  {backend:<11} {'file size':<32} {file_size / 1024:13.1f} KiB", file=sys.stderr)
+            os.remove(path)
+
+
+def bench_routes(results, ledger, path, backend, repeat):
+    """Time each Flask route of ``web_app.py`` through the test client."""
+    web_app = load_web_app()
+    if web_app is None:
+        return
+
+    web_app.tracker = web_app.BudgetTracker(path, journaled=(backend == 'journal'))
+    client = web_app.app.test_client()
+    transaction_id = ledger[len(ledger) // 2].id
+    for route in WEB_ROUTES:
+        url = route.format(id=transaction_id)
+
+        def request():
+            response = client.get(url)
+            response.get_data()
+            assert response.status_code < 400, f"{url} returned {response.status_code}"
+
+        record(results, len(ledger), backend, f"GET {route}", timed(request, repeat))
+
+
+def bench_concurrency(results, ledger, path, backend, threads):
+    """Run concurrent writers and readers against ``web_app.py``, then check consistency.
+
+    ``threads`` writer threads each POST one add (every fourth deletes a
+    ledger row instead) while as many reader threads GET the main pages.
+    Afterwards the in-memory ledger, its running totals and a fresh load
+    from disk must all agree with the writes that succeeded.
+    """
+    web_app = load_web_app()
+    if web_app is None:
+        return
+
+    journaled = backend == 'journal'
+    tracker = web_app.tracker = web_app.BudgetTracker(path, journaled=journaled)
+    expected_ids = {t.id for t in tracker.transactions}
+    doomed = [t.id for t in ledger[:threads:4]]
+    lock = threading.Lock()
+    failures = []
+    barrier = threading.Barrier(threads * 2)
+
+    def writer(i):
+        client = web_app.app.test_client()
+        barrier.wait()
+        if i % 4 == 0:
+            response = client.post(f"/delete_transaction/{doomed[i // 4]}")
+        else:
+            response = client.post('/add_transaction', data={
+                'name': f"Stress {i}", 'amount': '12.34', 'category': Category.FOOD.value,
+                'transaction_type': TransactionType.EXPENSE.value, 'tags': 'stress'
+            })
+        if response.status_code != 302 or not response.location.endswith('/transactions'):
+            with lock:
+                failures.append(f"writer {i}: {response.status_code} {response.location}")
+
+    def reader(i):
+        client = web_app.app.test_client()
+        barrier.wait()
+        url = STRESS_READ_ROUTES[i % len(STRESS_READ_ROUTES)]
+        response = client.get(url)
+        response.get_data()
+        if response.status_code != 200:
+            with lock:
+                failures.append(f"reader {i}: GET {url} returned {response.status_code}")
+
+    workers = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+    workers += [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    tracker.compact(wait=True)
+    expected_ids.difference_update(doomed)
+    expected_count = len(expected_ids) + threads - len(doomed)
+    reloaded = web_app.BudgetTracker(path, journaled=journaled)
+    live_ids = {t.id for t in tracker.transactions}
+    if len(live_ids) != expected_count or not expected_ids <= live_ids:
+        failures.append(f"in-memory ledger has {len(live_ids)} rows, expected {expected_count}")
+    if {t.id for t in reloaded.transactions} != live_ids:
+        failures.append("ledger reloaded from disk differs from the in-memory ledger")
+    try:
+        tracker.verify_totals()
+    except AssertionError as e:
+        failures.append(str(e))
+
+    record(results, len(ledger), backend, f"concurrent {threads}w/{threads}r", [elapsed],
+           failures=len(failures))
+    for failure in failures[:10]:
+        print(f"    FAILED: {failure}", file=sys.stderr)
+    if failures:
+        raise AssertionError(f"{len(failures)} concurrency failures on {backend}")
+
+
+def crash_writer(path, backend):
+    """Add transactions until killed, printing each id once its add has returned."""
+    tracker = BudgetTracker(path, journaled=(backend == 'journal'), partitioned=(backend == 'partitioned'),
+                            compact_after_records=50)
+    for i in itertools.count():
+        transaction = tracker.add_transaction(f"Crash {i}", 1.5, Category.FOOD, TransactionType.EXPENSE,
+                                              transaction_date=date(2024, 1 + i % 12, 1 + i % 28))
+        print('ack', transaction.id, flush=True)
+
+
+def bench_crash(results, backend, workdir, kills):
+    """SIGKILL a writer process ``kills`` times mid-write, then check that no acknowledged add is lost.
+
+    The writer runs in a subprocess and prints the id of every add that
+    returned. After each kill the store is reloaded: every printed id must
+    be there and no data file may have been set aside as corrupt. The
+    journaled backend compacts every 50 records, so kills also land
+    inside snapshot rewrites. Every other run of the journaled backend
+    starts on a journal whose last record was cut off mid-line, as an
+    append interrupted by a power cut leaves it, and is killed after its
+    first add, before a compaction could rewrite that add from memory.
+    """
+    path = data_path(workdir, 'crash', backend)
+    rng = random.Random(11)
+    acknowledged = set()
+    failures = []
+    durations = []
+    for kill in range(1, kills + 1):
+        torn = backend == 'journal' and kill % 2 == 0
+        if torn:
+            with open(f"{path}.journal", 'a') as f:
+                f.write('{"seq":999999,"op":"add","transaction":{"id":"torn')
+        writer = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--crash-writer', path, backend],
+                                  stdout=subprocess.PIPE, text=True)
+        # Wait until the writer has acknowledged its first add
+        lines = [writer.stdout.readline()]
+        while lines[-1] and not lines[-1].startswith('ack '):
+            lines.append(writer.stdout.readline())
+        time.sleep(0 if torn else rng.uniform(0, 0.2))
+        writer.kill()
+        output = ''.join(lines) + writer.communicate()[0]
+        # A line cut short by the kill was never acknowledged
+        acknowledged.update(line.split()[1] for line in output.splitlines(keepends=True)
+                            if line.startswith('ack ') and line.endswith('\n'))
+
+        start = time.perf_counter()
+        tracker = make_tracker(path, backend)
+        durations.append(time.perf_counter() - start)
+        missing = acknowledged - {t.id for t in tracker.transactions}
+        if missing:
+            failures.append(f"kill {kill}: {len(missing)} acknowledged adds lost")
+        corrupt = glob.glob(f"{path}.corrupt-*") + glob.glob(os.path.join(path, '*.corrupt-*'))
+        if corrupt:
+            failures.append(f"kill {kill}: data set aside as corrupt: {', '.join(corrupt)}")
+            break
+
+    record(results, 0, backend, f"reload after SIGKILL x{kills}", durations,
+           acknowledged=len(acknowledged), failures=len(failures))
+    for failure in failures[:10]:
+        print(f"    FAILED: {failure}", file=sys.stderr)
+    if failures:
+        raise AssertionError(f"{len(failures)} crash recovery failures on {backend}")
+
+
+def git_commit():
+    """Current commit hash, if the suite runs inside a git checkout."""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=HERE,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, backends, repeat, years, routes, stress=0, codecs=False, crash=0):
+    """Run the whole suite and return the results document."""
+    results = []
+    with tempfile.TemporaryDirectory(prefix='budget-bench-') as workdir:
+        for size in sizes:
+            print(f"Generating {size:,} transactions...", file=sys.stderr)
+            start = time.perf_counter()
+            ledger = generate_ledger(size, years=years)
+            record(results, size, '-', 'generate_ledger', [time.perf_counter() - start])
+
+            for backend in backends:
+                path = bench_core(results, ledger, backend, workdir, repeat)
+                if routes:
+                    bench_routes(results, ledger, path, backend, repeat)
+                if stress:
+                    bench_concurrency(results, ledger, path, backend, stress)
+            if codecs:
+                bench_codecs(results, ledger, workdir, repeat)
+
+        if crash:
+            for backend in backends:
+                bench_crash(results, backend, workdir, crash)
+
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now().isoformat(),
+            'repeat': repeat,
+            'years': years,
+            'stress_threads': stress,
+            'codecs': codecs,
+            'crash_kills': crash
+        },
+        'results': results
+    }
+
+
+def compare(baseline_file, current_file):
+    """Print the median ratio of each operation between two result files."""
+    with open(baseline_file) as f:
+        baseline = {(r['size'], r['backend'], r['operation']): r for r in json.load(f)['results']}
+    with open(current_file) as f:
+        current = json.load(f)['results']
+
+    print(f"{'Size':>9} {'Backend':<8} {'Operation':<32} {'Before ms':>11} {'After ms':>11} {'Ratio':>7}")
+    for entry in current:
+        before = baseline.get((entry['size'], entry['backend'], entry['operation']))
+        if before is None:
+            continue
+        ratio = entry['median_s'] / before['median_s'] if before['median_s'] else float('inf')
+        print(f"{entry['size']:>9} {entry['backend']:<11} {entry['operation']:<32} "
+              f"{before['median_s'] * 1000:11.3f} {entry['median_s'] * 1000:11.3f} {ratio:7.2f}")
+
+
+def main():
+    """Parse arguments and run the benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmark the Professional Budget Tracker")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help="ledger sizes to generate (default: 10k 100k 1M)")
+    parser.add_argument('--backends', nargs='+', default=['json', 'journal', 'sqlite', 'binary', 'partitioned'],
+                        choices=['json', 'journal', 'sqlite', 'binary', 'partitioned'],
+                        help="storage backends to time")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per operation")
+    parser.add_argument('--years', type=int, default=5, help="years of history to generate")
+    parser.add_argument('--no-routes', action='store_true', help="skip the Flask route timings")
+    parser.add_argument('--stress', type=int, default=0, metavar='THREADS',
+                        help="also run THREADS concurrent writers and readers against the web app "
+                             "and verify the ledger afterwards (e.g. --stress 200)")
+    parser.add_argument('--codecs', action='store_true',
+                        help="also compare snapshot size and save/load time for each compression codec")
+    parser.add_argument('--crash', type=int, default=0, metavar='KILLS',
+                        help="also SIGKILL a writer process KILLS times per backend and check that "
+                             "every acknowledged add survives (e.g. --crash 25)")
+    parser.add_argument('--crash-writer', nargs=2, metavar=('PATH', 'BACKEND'), help=argparse.SUPPRESS)
+    parser.add_argument('--output', help="write the JSON results here instead of stdout")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help="compare two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.crash_writer:
+        crash_writer(*args.crash_writer)
+        return
+
+    document = run(args.sizes, args.backends, args.repeat, args.years, not args.no_routes, args.stress,
+                   args.codecs, args.crash)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        json.dump(document, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
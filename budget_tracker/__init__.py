@@ -0,0 +1,57 @@
+"""
+Professional Budget Tracker Application
+A comprehensive personal finance management system with data persistence,
+categorization, reporting, and interactive CLI interface.
+
+Author: [Your Name]
+Version: 1.0.0
+
+Public names are imported from their submodules on first access, so
+importing the package (for example just to run the CLI) only loads the
+parts that are actually used.
+"""
+
+import importlib
+
+__version__ = "1.0.0"
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'TransactionType': 'models',
+    'Category': 'models',
+    'Transaction': 'models',
+    'EMPTY_TAGS': 'models',
+    'TransactionJournal': 'storage',
+    'Storage': 'storage',
+    'JSONStorage': 'storage',
+    'SQLiteStorage': 'storage',
+    'open_storage': 'storage',
+    'convert_storage': 'storage',
+    'BinaryStorage': 'binary',
+    'BinaryLedger': 'binary',
+    'PartitionedStorage': 'partitions',
+    'ColumnarLedger': 'analytics',
+    'BudgetTracker': 'tracker',
+    'ImportReport': 'tracker',
+    'CSV_FIELDNAMES': 'tracker',
+    'DEFAULT_PAGE_SIZE': 'tracker',
+    'MAX_PAGE_SIZE': 'tracker',
+    'gzip_stream': 'tracker',
+    'BudgetTrackerCLI': 'cli',
+    'main': 'cli',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,6 @@
+"""Run the budget tracker CLI with ``python -m budget_tracker``."""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
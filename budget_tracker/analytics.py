@@ -0,0 +1,114 @@
+"""
+Columnar analytics engine for large ledgers (requires NumPy).
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from .models import Category, Transaction, TransactionType
+
+
+class ColumnarLedger:
+    """Column-oriented copy of a ledger for vectorized analytics.
+    
+    Amounts (in cents), dates, category codes and type codes are held in parallel NumPy
+    arrays, so sums, group-bys and date-range masks run without touching
+    Python objects. NumPy is an optional dependency used only by this class.
+    """
+    
+    CATEGORIES = list(Category)
+    TYPES = list(TransactionType)
+    
+    def __init__(self, transactions: Iterable[Transaction]):
+        """Build the columns from a sequence of transactions."""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("The columnar analytics engine requires NumPy: pip install numpy")
+        
+        self._np = np
+        transactions = list(transactions)
+        count = len(transactions)
+        category_codes = {c: i for i, c in enumerate(self.CATEGORIES)}
+        type_codes = {t: i for i, t in enumerate(self.TYPES)}
+        epoch = date(1970, 1, 1).toordinal()
+        
+        self.cents = np.fromiter((t.amount_cents for t in transactions), dtype=np.int64, count=count)
+        self.dates = np.fromiter((t.date.toordinal() - epoch for t in transactions),
+                                 dtype=np.int64, count=count).astype('datetime64[D]')
+        self.categories = np.fromiter((category_codes[t.category] for t in transactions),
+                                      dtype=np.int8, count=count)
+        self.types = np.fromiter((type_codes[t.transaction_type] for t in transactions),
+                                 dtype=np.int8, count=count)
+    
+    def __len__(self) -> int:
+        return len(self.cents)
+    
+    def mask(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+             transaction_type: Optional[TransactionType] = None):
+        """Boolean mask selecting rows in a date range and of one type."""
+        np = self._np
+        selected = np.ones(len(self.cents), dtype=bool)
+        if start_date is not None:
+            selected &= self.dates >= np.datetime64(start_date, 'D')
+        if end_date is not None:
+            selected &= self.dates <= np.datetime64(end_date, 'D')
+        if transaction_type is not None:
+            selected &= self.types == self.TYPES.index(transaction_type)
+        return selected
+    
+    def total(self, transaction_type: Optional[TransactionType] = None,
+              start_date: Optional[date] = None, end_date: Optional[date] = None) -> float:
+        """Sum the amounts matching the filters."""
+        return int(self.cents[self.mask(start_date, end_date, transaction_type)].sum()) / 100
+    
+    def category_totals(self, transaction_type: TransactionType = TransactionType.EXPENSE,
+                        start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict[str, float]:
+        """Sum the amounts per category, keyed by category name."""
+        np = self._np
+        selected = self.mask(start_date, end_date, transaction_type)
+        codes = self.categories[selected]
+        sums = np.bincount(codes, weights=self.cents[selected], minlength=len(self.CATEGORIES))
+        counts = np.bincount(codes, minlength=len(self.CATEGORIES))
+        return {self.CATEGORIES[i].value: round(sums[i]) / 100 for i in np.flatnonzero(counts)}
+    
+    def monthly_summary(self, year: int, month: int) -> Dict:
+        """Summarize one month in the same shape as ``BudgetTracker.get_monthly_summary``."""
+        start_date = date(year, month, 1)
+        end_date = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        selected = self.mask(start_date, end_date)
+        is_income = self.types[selected] == self.TYPES.index(TransactionType.INCOME)
+        cents = self.cents[selected]
+        income = int(cents[is_income].sum())
+        expenses = int(cents[~is_income].sum())
+        
+        return {
+            'income': income / 100,
+            'expenses': expenses / 100,
+            'balance': (income - expenses) / 100,
+            'category_totals': self.category_totals(TransactionType.EXPENSE, start_date, end_date),
+            'transaction_count': int(selected.sum())
+        }
+    
+    def monthly_totals(self) -> List[Dict]:
+        """Resample the ledger into per-month income, expenses and balance, oldest first."""
+        np = self._np
+        months = self.dates.astype('datetime64[M]')
+        labels, index = np.unique(months, return_inverse=True)
+        is_income = self.types == self.TYPES.index(TransactionType.INCOME)
+        income = np.bincount(index, weights=np.where(is_income, self.cents, 0), minlength=len(labels))
+        expenses = np.bincount(index, weights=np.where(is_income, 0, self.cents), minlength=len(labels))
+        counts = np.bincount(index, minlength=len(labels))
+        
+        results = []
+        for i, label in enumerate(labels):
+            year, month = (int(part) for part in str(label).split('-'))
+            results.append({
+                'year': year,
+                'month': month,
+                'income': round(income[i]) / 100,
+                'expenses': round(expenses[i]) / 100,
+                'balance': round(income[i] - expenses[i]) / 100,
+                'transaction_count': int(counts[i])
+            })
+        return results
@@ -0,0 +1,283 @@
+"""
+Compact binary ledger format, read in place through ``mmap``.
+
+A file holds a short header, one fixed-width record per transaction
+sorted by date, and a heap with the variable-length strings:
+
+    magic (8 bytes) | metadata length (u32) | metadata (JSON) | padding
+    records: count x RECORD, oldest first
+    heap: per record its id, name, description and tags (JSON), back to back
+
+A record holds the amount in cents, the date ordinal, the category and
+type codes (indexes into the lists stored in the metadata) and the
+offset and lengths of the record's strings in the heap.
+"""
+
+import json
+import mmap
+import struct
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import CATEGORY_BY_VALUE, TRANSACTION_TYPE_BY_VALUE, Category, Transaction, TransactionType
+from .storage import JSONStorage, TransactionJournal, _codec, _write_atomically, open_data
+
+MAGIC = b'BTLEDGR1'
+PREFIX = struct.Struct('<8sI')
+
+# cents, date ordinal, category code, type code, heap offset,
+# id length, name length, description length, tags length
+RECORD = struct.Struct('<qiBBxxQIIII')
+
+# The leading numeric fields of a record, for scans that skip the strings
+_NUMBERS = struct.Struct(f'<qiBB{RECORD.size - 14}x')
+
+# Description length marking a transaction without a description
+NO_DESCRIPTION = 0xFFFFFFFF
+
+
+@lru_cache(maxsize=8192)
+def _date(ordinal: int) -> date:
+    """Date for an ordinal, shared by every record on that day."""
+    return date.fromordinal(ordinal)
+
+
+@lru_cache(maxsize=4096)
+def _tags(encoded: bytes) -> Tuple[str, ...]:
+    """Tags from their JSON encoding; ledgers repeat a few combinations many times."""
+    return tuple(json.loads(encoded))
+
+
+def write_ledger(f: IO, transactions: Iterable[Transaction], journal_seq: int = 0) -> None:
+    """Write transactions to a binary file opened for writing in binary mode."""
+    rows = sorted(transactions, key=lambda t: t.date)
+    categories = list(Category)
+    types = list(TransactionType)
+    category_codes = {c: i for i, c in enumerate(categories)}
+    type_codes = {t: i for i, t in enumerate(types)}
+    
+    records = bytearray(RECORD.size * len(rows))
+    heap = bytearray()
+    for i, t in enumerate(rows):
+        id_bytes = t.id.encode()
+        name_bytes = t.name.encode()
+        description_bytes = t.description.encode() if t.description is not None else b''
+        tags_bytes = json.dumps(list(t.tags)).encode() if t.tags else b''
+        RECORD.pack_into(records, i * RECORD.size, t.amount_cents, t.date.toordinal(),
+                         category_codes[t.category], type_codes[t.transaction_type], len(heap),
+                         len(id_bytes), len(name_bytes),
+                         NO_DESCRIPTION if t.description is None else len(description_bytes),
+                         len(tags_bytes))
+        heap += id_bytes + name_bytes + description_bytes + tags_bytes
+    
+    metadata = json.dumps({
+        'count': len(rows),
+        'heap_size': len(heap),
+        'journal_seq': journal_seq,
+        'categories': [c.value for c in categories],
+        'types': [t.value for t in types],
+        'last_updated': datetime.now().isoformat()
+    }).encode()
+    header = PREFIX.pack(MAGIC, len(metadata)) + metadata
+    header += b'\0' * (-len(header) % 8)  # keep the records 8-byte aligned
+    f.write(header)
+    f.write(records)
+    f.write(heap)
+
+
+class BinaryLedger:
+    """Read-only view of a binary ledger file mapped into memory.
+    
+    Nothing is decoded up front: records are unpacked in place on demand.
+    Because records are sorted by date, a date range is found by binary
+    search, and sums and group-bys read only the numeric fields without
+    creating ``Transaction`` objects. A compressed file (``.bin.gz`` and so
+    on) cannot be mapped, so it is decompressed into memory instead.
+    
+    The view covers the snapshot only. Changes journaled since it was
+    written (``journaled=True``) would make its answers stale, so such a
+    file is refused until the journal is compacted.
+    """
+    
+    def __init__(self, path: Path, ignore_journal: bool = False):
+        """Map the file at ``path`` and validate its header.
+        
+        Raises ValueError if the file is empty, truncated or not a ledger,
+        or if its journal holds changes the snapshot lacks. ``BinaryStorage``
+        replays those itself and passes ``ignore_journal``.
+        """
+        self.path = Path(path)
+        if _codec(self.path) is None:
+            with open(self.path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            with open_data(self.path, 'rb') as f:
+                self._map = f.read()
+        try:
+            if len(self._map) < PREFIX.size:
+                raise ValueError(f"{self.path} is too short to be a binary ledger")
+            magic, metadata_size = PREFIX.unpack_from(self._map)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a binary ledger")
+            metadata = json.loads(self._map[PREFIX.size:PREFIX.size + metadata_size])
+            self.count: int = metadata['count']
+            self.journal_seq: int = metadata['journal_seq']
+            self._categories = [CATEGORY_BY_VALUE[value] for value in metadata['categories']]
+            self._types = [TRANSACTION_TYPE_BY_VALUE[value] for value in metadata['types']]
+            header_size = PREFIX.size + metadata_size
+            self._records = header_size + (-header_size % 8)
+            self._heap = self._records + self.count * RECORD.size
+            if self._heap + metadata['heap_size'] > len(self._map):
+                raise ValueError(f"{self.path} is truncated")
+            if not ignore_journal:
+                journal = TransactionJournal(self.path.with_name(self.path.name + '.journal'))
+                records = journal.replay(after_seq=self.journal_seq)
+                pending = next(records, None) is not None
+                records.close()
+                if pending:
+                    raise ValueError(f"{self.path} has journaled changes that are not in the snapshot; "
+                                     f"compact it first")
+        except BaseException:
+            self.close()
+            raise
+    
+    def close(self) -> None:
+        """Unmap the file."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+    
+    def __enter__(self) -> 'BinaryLedger':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __iter__(self) -> Iterator[Transaction]:
+        """Yield every transaction, oldest first."""
+        return self.range()
+    
+    def transaction(self, index: int) -> Transaction:
+        """Decode the record at ``index`` (in date order) into a transaction."""
+        (cents, ordinal, category, transaction_type, offset,
+         id_size, name_size, description_size, tags_size) = RECORD.unpack_from(
+            self._map, self._records + index * RECORD.size)
+        heap = self._map
+        start = self._heap + offset
+        end = start + id_size
+        transaction_id = heap[start:end].decode()
+        start, end = end, end + name_size
+        name = heap[start:end].decode()
+        description = None
+        if description_size != NO_DESCRIPTION:
+            start, end = end, end + description_size
+            description = heap[start:end].decode()
+        tags = _tags(heap[end:end + tags_size]) if tags_size else None
+        return Transaction(transaction_id, name, cents / 100, self._categories[category],
+                           self._types[transaction_type], _date(ordinal), description, tags)
+    
+    def _ordinal(self, index: int) -> int:
+        """Date ordinal of the record at ``index``."""
+        return struct.unpack_from('<i', self._map, self._records + index * RECORD.size + 8)[0]
+    
+    def _bound(self, ordinal: int) -> int:
+        """Index of the first record dated on or after ``ordinal``."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ordinal(mid) < ordinal:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    def _bounds(self, start_date: Optional[date], end_date: Optional[date]) -> Tuple[int, int]:
+        """Index range of the records in an inclusive date range."""
+        lo = 0 if start_date is None else self._bound(start_date.toordinal())
+        hi = self.count if end_date is None else self._bound(end_date.toordinal() + 1)
+        return lo, max(lo, hi)
+    
+    def range(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Iterator[Transaction]:
+        """Yield the transactions in an inclusive date range, oldest first."""
+        lo, hi = self._bounds(start_date, end_date)
+        for index in range(lo, hi):
+            yield self.transaction(index)
+    
+    def _scan(self, start_date: Optional[date], end_date: Optional[date]) -> Iterator[Tuple[int, int, int, int]]:
+        """Yield ``(cents, ordinal, category code, type code)`` for a date range."""
+        lo, hi = self._bounds(start_date, end_date)
+        with memoryview(self._map) as view:
+            records = view[self._records + lo * RECORD.size:self._records + hi * RECORD.size]
+            try:
+                yield from _NUMBERS.iter_unpack(records)
+            finally:
+                records.release()
+    
+    def total(self, transaction_type: Optional[TransactionType] = None,
+              start_date: Optional[date] = None, end_date: Optional[date] = None) -> float:
+        """Sum the amounts matching the filters."""
+        if transaction_type is None:
+            return sum(cents for cents, _, _, _ in self._scan(start_date, end_date)) / 100
+        code = self._types.index(transaction_type)
+        return sum(cents for cents, _, _, t in self._scan(start_date, end_date) if t == code) / 100
+    
+    def category_totals(self, transaction_type: TransactionType = TransactionType.EXPENSE,
+                        start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict[str, float]:
+        """Sum the amounts per category, keyed by category name."""
+        code = self._types.index(transaction_type)
+        sums: Dict[int, int] = {}
+        for cents, _, category, t in self._scan(start_date, end_date):
+            if t == code:
+                sums[category] = sums.get(category, 0) + cents
+        return {self._categories[category].value: cents / 100 for category, cents in sums.items()}
+    
+    def monthly_summary(self, year: int, month: int) -> Dict:
+        """Summarize one month in the same shape as ``BudgetTracker.get_monthly_summary``."""
+        start_date = date(year, month, 1)
+        end_date = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        income_code = self._types.index(TransactionType.INCOME)
+        income = expenses = 0
+        count = 0
+        category_cents: Dict[int, int] = {}
+        for cents, _, category, t in self._scan(start_date, end_date):
+            count += 1
+            if t == income_code:
+                income += cents
+            else:
+                expenses += cents
+                category_cents[category] = category_cents.get(category, 0) + cents
+        
+        return {
+            'income': income / 100,
+            'expenses': expenses / 100,
+            'balance': (income - expenses) / 100,
+            'category_totals': {self._categories[c].value: cents / 100 for c, cents in category_cents.items()},
+            'transaction_count': count
+        }
+
+
+class BinaryStorage(JSONStorage):
+    """Binary ledger snapshot with the same optional journal as ``JSONStorage``.
+    
+    Snapshots are several times smaller than the JSON ones and load
+    without parsing text. Loading still decodes every record: the
+    tracker's indexes, running totals and in-place updates need
+    ``Transaction`` objects. Read-only reporting that should not pay for
+    that can use ``BinaryLedger`` on the file directly.
+    """
+    
+    def _read_snapshot(self, transactions: List[Transaction]) -> int:
+        """Append the snapshot's transactions to ``transactions`` and return its journal sequence."""
+        with BinaryLedger(self.path, ignore_journal=True) as ledger:
+            transactions.extend(ledger)
+            return ledger.journal_seq
+    
+    def _write_snapshot(self, transactions: List[Transaction], marker: int,
+                        install: Optional[Callable[[Path], None]] = None) -> None:
+        """Write the snapshot file atomically; ``install`` goes to ``_write_atomically``."""
+        _write_atomically(self.path, lambda f: write_ledger(f, transactions, marker), mode='wb',
+                          install=install)
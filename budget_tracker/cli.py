@@ -0,0 +1,314 @@
+"""
+Interactive command-line interface for the budget tracker.
+"""
+
+import locale
+import sys
+from datetime import date
+
+from .models import Category, TransactionType
+from .tracker import BudgetTracker, ImportReport
+
+
+class BudgetTrackerCLI:
+    """Command-line interface for the budget tracker."""
+    
+    def __init__(self):
+        """Initialize the CLI interface."""
+        self.tracker = BudgetTracker()
+        self.running = True
+    
+    def format_currency(self, amount: float) -> str:
+        """Format amount as currency."""
+        return locale.currency(amount, grouping=True)
+    
+    def display_menu(self) -> None:
+        """Display the main menu."""
+        print("\n" + "="*50)
+        print("💰 PROFESSIONAL BUDGET TRACKER 💰")
+        print("="*50)
+        print("1. Add Transaction")
+        print("2. View All Transactions")
+        print("3. View Balance Summary")
+        print("4. View Monthly Summary")
+        print("5. View Transactions by Category")
+        print("6. Remove Transaction")
+        print("7. Export to CSV")
+        print("8. Import from CSV")
+        print("9. Exit")
+        print("="*50)
+    
+    def get_category_choice(self) -> Category:
+        """Get category choice from user."""
+        print("\nAvailable Categories:")
+        for i, category in enumerate(Category, 1):
+            print(f"{i:2d}. {category.value}")
+        
+        while True:
+            try:
+                choice = int(input("\nSelect category (1-15): ")) - 1
+                if 0 <= choice < len(Category):
+                    return list(Category)[choice]
+                else:
+                    print("Invalid choice. Please try again.")
+            except ValueError:
+                print("Please enter a valid number.")
+    
+    def add_transaction_flow(self) -> None:
+        """Handle adding a new transaction."""
+        print("\n--- Add New Transaction ---")
+        
+        # Get transaction type
+        print("Transaction Type:")
+        print("1. Expense")
+        print("2. Income")
+        
+        while True:
+            try:
+                type_choice = int(input("Select type (1-2): "))
+                if type_choice in [1, 2]:
+                    transaction_type = TransactionType.EXPENSE if type_choice == 1 else TransactionType.INCOME
+                    break
+                else:
+                    print("Invalid choice. Please try again.")
+            except ValueError:
+                print("Please enter a valid number.")
+        
+        # Get transaction details
+        name = input("Transaction name: ").strip()
+        if not name:
+            print("Name cannot be empty.")
+            return
+        
+        while True:
+            try:
+                amount = float(input("Amount: $"))
+                if amount <= 0:
+                    print("Amount must be positive.")
+                    continue
+                break
+            except ValueError:
+                print("Please enter a valid amount.")
+        
+        category = self.get_category_choice()
+        description = input("Description (optional): ").strip() or None
+        tags_input = input("Tags (comma-separated, optional): ").strip()
+        tags = [tag.strip() for tag in tags_input.split(',')] if tags_input else []
+        
+        # Add transaction
+        try:
+            transaction = self.tracker.add_transaction(
+                name=name,
+                amount=amount,
+                category=category,
+                transaction_type=transaction_type,
+                description=description,
+                tags=tags
+            )
+            print(f"\n✅ Transaction added successfully!")
+            print(f"ID: {transaction.id}")
+            print(f"Name: {transaction.name}")
+            print(f"Amount: {self.format_currency(transaction.amount)}")
+            print(f"Category: {transaction.category.value}")
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+    
+    def view_transactions(self) -> None:
+        """Display all transactions."""
+        if not self.tracker.transactions:
+            print("\n📭 No transactions found.")
+            return
+        
+        print(f"\n📋 All Transactions ({len(self.tracker.transactions)} total)")
+        print("-" * 80)
+        print(f"{'ID':<8} {'Date':<12} {'Type':<8} {'Category':<20} {'Amount':<12} {'Name'}")
+        print("-" * 80)
+        
+        for transaction in self.tracker.recent(len(self.tracker.transactions)):
+            amount_str = self.format_currency(transaction.amount)
+            type_icon = "💸" if transaction.transaction_type == TransactionType.EXPENSE else "💰"
+            print(f"{transaction.id:<8} {transaction.date:<12} {type_icon:<8} "
+                  f"{transaction.category.value:<20} {amount_str:<12} {transaction.name}")
+    
+    def view_balance_summary(self) -> None:
+        """Display balance summary."""
+        total_income = self.tracker.get_total_income()
+        total_expenses = self.tracker.get_total_expenses()
+        balance = self.tracker.get_balance()
+        
+        print("\n📊 Balance Summary")
+        print("=" * 40)
+        print(f"Total Income:    {self.format_currency(total_income)}")
+        print(f"Total Expenses:  {self.format_currency(total_expenses)}")
+        print("-" * 40)
+        
+        if balance >= 0:
+            print(f"Net Balance:     💚 {self.format_currency(balance)}")
+        else:
+            print(f"Net Balance:     🔴 {self.format_currency(balance)}")
+        
+        if total_income > 0:
+            savings_rate = ((total_income - total_expenses) / total_income) * 100
+            print(f"Savings Rate:    {savings_rate:.1f}%")
+    
+    def view_monthly_summary(self) -> None:
+        """Display monthly summary."""
+        current_date = date.today()
+        year = current_date.year
+        month = current_date.month
+        
+        # Allow user to select different month/year
+        print(f"\n📅 Monthly Summary")
+        print(f"Current: {current_date.strftime('%B %Y')}")
+        
+        try:
+            year_input = input(f"Enter year ({year}): ").strip()
+            if year_input:
+                year = int(year_input)
+            
+            month_input = input(f"Enter month (1-12, {month}): ").strip()
+            if month_input:
+                month = int(month_input)
+                if not (1 <= month <= 12):
+                    raise ValueError("Month must be between 1 and 12")
+        except ValueError as e:
+            print(f"Invalid input: {e}")
+            return
+        
+        summary = self.tracker.get_monthly_summary(year, month)
+        
+        print(f"\n📊 Summary for {date(year, month, 1).strftime('%B %Y')}")
+        print("=" * 50)
+        print(f"Income:          {self.format_currency(summary['income'])}")
+        print(f"Expenses:        {self.format_currency(summary['expenses'])}")
+        print(f"Balance:         {self.format_currency(summary['balance'])}")
+        print(f"Transactions:    {summary['transaction_count']}")
+        
+        if summary['category_totals']:
+            print("\n📈 Expenses by Category:")
+            for category, amount in sorted(summary['category_totals'].items(), 
+                                         key=lambda x: x[1], reverse=True):
+                print(f"  {category:<20} {self.format_currency(amount)}")
+    
+    def view_transactions_by_category(self) -> None:
+        """Display transactions grouped by category."""
+        category = self.get_category_choice()
+        transactions = self.tracker.get_transactions_by_category(category)
+        
+        if not transactions:
+            print(f"\n📭 No transactions found for category: {category.value}")
+            return
+        
+        total = sum(t.amount for t in transactions)
+        print(f"\n📋 Transactions for {category.value} (Total: {self.format_currency(total)})")
+        print("-" * 70)
+        print(f"{'Date':<12} {'Type':<8} {'Amount':<12} {'Name'}")
+        print("-" * 70)
+        
+        for transaction in sorted(transactions, key=lambda x: x.date, reverse=True):
+            amount_str = self.format_currency(transaction.amount)
+            type_icon = "💸" if transaction.transaction_type == TransactionType.EXPENSE else "💰"
+            print(f"{transaction.date:<12} {type_icon:<8} {amount_str:<12} {transaction.name}")
+    
+    def remove_transaction_flow(self) -> None:
+        """Handle removing a transaction."""
+        if not self.tracker.transactions:
+            print("\n📭 No transactions to remove.")
+            return
+        
+        print("\n--- Remove Transaction ---")
+        transaction_id = input("Enter transaction ID to remove: ").strip()
+        
+        if self.tracker.remove_transaction(transaction_id):
+            print("✅ Transaction removed successfully!")
+        else:
+            print("❌ Transaction not found.")
+    
+    def export_to_csv_flow(self) -> None:
+        """Handle CSV export."""
+        filename = input("Enter filename for export (default: budget_export.csv): ").strip()
+        if not filename:
+            filename = "budget_export.csv"
+        
+        if not filename.endswith('.csv'):
+            filename += '.csv'
+        
+        try:
+            self.tracker.export_to_csv(filename)
+            print(f"✅ Data exported successfully to {filename}")
+        except Exception as e:
+            print(f"❌ Export failed: {e}")
+    
+    def import_from_csv_flow(self) -> None:
+        """Handle CSV import."""
+        filename = input("Enter CSV file to import (default: budget_export.csv): ").strip()
+        if not filename:
+            filename = "budget_export.csv"
+        
+        def show_progress(report: ImportReport) -> None:
+            print(f"  ... {report.imported} transactions imported", end='\r')
+        
+        try:
+            report = self.tracker.import_csv(filename, progress=show_progress)
+        except (OSError, ValueError) as e:
+            print(f"❌ Import failed: {e}")
+            return
+        
+        print(f"✅ Imported {report.imported} of {report.rows_read} rows from {filename}")
+        if report.errors:
+            print(f"⚠️  {len(report.errors)} rows skipped:")
+            for line_number, error in report.errors[:10]:
+                print(f"  Line {line_number}: {error}")
+            if len(report.errors) > 10:
+                print(f"  ... and {len(report.errors) - 10} more")
+    
+    def run(self) -> None:
+        """Run the CLI application."""
+        print("🚀 Starting Professional Budget Tracker...")
+        
+        while self.running:
+            try:
+                self.display_menu()
+                choice = input("\nSelect an option (1-9): ").strip()
+                
+                if choice == '1':
+                    self.add_transaction_flow()
+                elif choice == '2':
+                    self.view_transactions()
+                elif choice == '3':
+                    self.view_balance_summary()
+                elif choice == '4':
+                    self.view_monthly_summary()
+                elif choice == '5':
+                    self.view_transactions_by_category()
+                elif choice == '6':
+                    self.remove_transaction_flow()
+                elif choice == '7':
+                    self.export_to_csv_flow()
+                elif choice == '8':
+                    self.import_from_csv_flow()
+                elif choice == '9':
+                    print("\n👋 Thank you for using Professional Budget Tracker!")
+                    self.running = False
+                else:
+                    print("❌ Invalid choice. Please try again.")
+                
+                if self.running:
+                    input("\nPress Enter to continue...")
+                    
+            except KeyboardInterrupt:
+                print("\n\n👋 Goodbye!")
+                self.running = False
+            except Exception as e:
+                print(f"\n❌ An error occurred: {e}")
+                input("Press Enter to continue...")
+
+
+def main():
+    """Main entry point of the application."""
+    try:
+        cli = BudgetTrackerCLI()
+        cli.run()
+    except Exception as e:
+        print(f"Fatal error: {e}")
+        sys.exit(1)
@@ -0,0 +1,113 @@
+"""
+Locking primitives shared by the tracker and its storage backends.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: file locks only exclude threads of this process
+    fcntl = None
+
+
+class ReadWriteLock:
+    """Lock that admits many readers at once or a single writer.
+    
+    Waiting writers take precedence over new readers, so a steady stream of
+    reads cannot starve them. Read locks are reentrant, and the thread
+    holding the write lock may also read; the write lock itself is not
+    reentrant and must not be requested while holding a read lock.
+    """
+    
+    def __init__(self):
+        """Initialize an unlocked lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writer = 0
+        self._local = threading.local()
+    
+    @contextmanager
+    def read(self):
+        """Hold the lock for reading for the duration of the block."""
+        depth = getattr(self._local, 'depth', 0)
+        shared = depth == 0 and self._writer != threading.get_ident()
+        if shared:
+            with self._cond:
+                while self._writer or self._writers_waiting:
+                    self._cond.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if shared:
+                with self._cond:
+                    self._readers -= 1
+                    if not self._readers:
+                        self._cond.notify_all()
+    
+    @contextmanager
+    def write(self):
+        """Hold the lock exclusively for the duration of the block."""
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = threading.get_ident()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = 0
+                self._cond.notify_all()
+
+
+class FileLock:
+    """Exclusive advisory lock on a lock file, reentrant within a thread.
+    
+    Threads of this process queue on an in-process lock; the first entry
+    also takes an ``fcntl.flock`` on ``path`` so other processes wait as
+    well. Without a path (or without ``fcntl``) only threads of this
+    process are excluded.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the lock for the given lock file path."""
+        self.path = Path(path) if path is not None else None
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+    
+    def __enter__(self) -> 'FileLock':
+        self._thread_lock.acquire()
+        if self._depth == 0 and self.path is not None and fcntl is not None:
+            try:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                except BaseException:
+                    os.close(fd)
+                    raise
+            except BaseException:
+                self._thread_lock.release()
+                raise
+            self._fd = fd
+        self._depth += 1
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
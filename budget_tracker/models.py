@@ -0,0 +1,147 @@
+"""
+Core data model: transaction types, categories and the Transaction record.
+"""
+
+import math
+import sys
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+from enum import Enum
+
+
+class TransactionType(Enum):
+    """Enumeration for transaction types."""
+    EXPENSE = "expense"
+    INCOME = "income"
+
+
+class Category(Enum):
+    """Predefined categories for transactions."""
+    # Expense categories
+    FOOD = "Food & Dining"
+    TRANSPORTATION = "Transportation"
+    HOUSING = "Housing"
+    UTILITIES = "Utilities"
+    ENTERTAINMENT = "Entertainment"
+    SHOPPING = "Shopping"
+    HEALTHCARE = "Healthcare"
+    EDUCATION = "Education"
+    TRAVEL = "Travel"
+    INSURANCE = "Insurance"
+    TAXES = "Taxes"
+    OTHER_EXPENSE = "Other Expense"
+    
+    # Income categories
+    SALARY = "Salary"
+    FREELANCE = "Freelance"
+    INVESTMENT = "Investment"
+    BUSINESS = "Business"
+    OTHER_INCOME = "Other Income"
+
+
+# Shared by every transaction without tags, so empty tag lists cost nothing
+EMPTY_TAGS: Tuple[str, ...] = ()
+
+# Stored values to members; a dict lookup is far cheaper than calling the Enum
+CATEGORY_BY_VALUE: Dict[str, Category] = {category.value: category for category in Category}
+TRANSACTION_TYPE_BY_VALUE: Dict[str, TransactionType] = {t.value: t for t in TransactionType}
+
+
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> date:
+    """Parse an ISO date, reusing the result for dates seen before.
+    
+    A ledger covers a few thousand distinct days at most, so loading it
+    parses each day once and every transaction on it shares one object.
+    """
+    return date.fromisoformat(value)
+
+
+def to_cents(amount: float) -> int:
+    """Convert a dollar amount to whole cents.
+    
+    Raises ValueError for infinite, NaN or overflowing amounts.
+    """
+    cents = amount * 100
+    if not math.isfinite(cents):
+        raise ValueError("Amount must be a finite number")
+    return round(cents)
+
+
+class Transaction:
+    """Compact record representing a financial transaction.
+    
+    Amounts are stored as integer cents and exposed as ``amount`` in
+    dollars. Names and tags are interned and tags are kept as a tuple, so
+    large ledgers with repeated values stay small.
+    """
+    
+    __slots__ = ('id', 'name', 'amount_cents', 'category', 'transaction_type',
+                 'date', 'description', 'tags')
+    
+    def __init__(self, id: str, name: str, amount: float, category: Category,
+                 transaction_type: TransactionType, date: date, description: Optional[str] = None,
+                 tags: Optional[Iterable[str]] = None):
+        self.id = id
+        self.name = sys.intern(name)
+        self.amount_cents = to_cents(amount)
+        self.category = category
+        self.transaction_type = transaction_type
+        self.date = date
+        self.description = description
+        self.tags = tuple(map(sys.intern, tags)) if tags else EMPTY_TAGS
+    
+    @property
+    def amount(self) -> float:
+        """Amount in dollars."""
+        return self.amount_cents / 100
+    
+    @amount.setter
+    def amount(self, value: float) -> None:
+        self.amount_cents = to_cents(value)
+    
+    def _fields(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"Transaction(id={self.id!r}, name={self.name!r}, amount={self.amount!r}, "
+                f"category={self.category!r}, transaction_type={self.transaction_type!r}, "
+                f"date={self.date!r}, description={self.description!r}, tags={list(self.tags)!r})")
+    
+    def to_dict(self) -> Dict:
+        """Convert transaction to dictionary for JSON serialization."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'amount': self.amount,
+            'category': self.category.value,
+            'transaction_type': self.transaction_type.value,
+            'date': self.date.isoformat(),
+            'description': self.description,
+            'tags': list(self.tags)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Transaction':
+        """Create transaction from dictionary.
+        
+        Unknown category or type values raise KeyError.
+        """
+        return cls(
+            data['id'],
+            data['name'],
+            data['amount'],
+            CATEGORY_BY_VALUE[data['category']],
+            TRANSACTION_TYPE_BY_VALUE[data['transaction_type']],
+            parse_date(data['date']),
+            data.get('description'),
+            data.get('tags')
+        )
@@ -0,0 +1,303 @@
+"""
+Time-partitioned storage: one snapshot segment per (year, month).
+"""
+
+import os
+import re
+import stat
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .models import Category, Transaction, TransactionType
+from .storage import CODECS, JSONStorage, Storage, _fsync_directory, open_storage, split_codec
+
+Month = Tuple[int, int]
+
+# Snapshot formats a segment can be stored in
+SEGMENT_SUFFIXES = ('.json', '.bin')
+
+
+class _Segment(NamedTuple):
+    """Parsed contents of one segment file and the stat they were read at."""
+    path: Path
+    stamp: Tuple[int, int, int]
+    frozen: bool
+    transactions: List[Transaction]
+
+
+class PartitionedStorage(Storage):
+    """Ledger kept in a directory with one segment file per month.
+    
+    Segments are named ``YYYY-MM<segment_suffix>`` and use the matching
+    snapshot format (``.json`` or ``.bin``, optionally compressed, as in
+    ``.json.gz``). A change rewrites only the segments of the months it
+    touches, and range and monthly queries read only the segments that
+    overlap them.
+    
+    Parsed segments are cached and re-read only when their file changes.
+    ``freeze()`` marks an old month read-only, optionally recompressing it
+    with a different codec: its segment stays cached for the life of the
+    store without being checked again, and changes to it are refused.
+    """
+    
+    incremental = True
+    
+    def __init__(self, path: Path, segment_suffix: str = '.json', durability: str = 'always',
+                 sync_interval: float = 0.1):
+        """Initialize (and if needed create) the segment directory at the given path."""
+        segment_format, _ = split_codec(Path('segment' + segment_suffix))
+        if segment_format not in SEGMENT_SUFFIXES:
+            raise ValueError(f"Unsupported segment format: {segment_suffix!r}")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        super().__init__(self.path / '.lock', durability, sync_interval)
+        self.segment_suffix = segment_suffix
+        self._segment_format = segment_format
+        # A month's segment may carry any codec, e.g. once frozen into an archive
+        codecs = '|'.join(re.escape(codec) for codec in CODECS)
+        self._pattern = re.compile(rf'(\d{{4}})-(\d{{2}}){re.escape(segment_format)}(?:{codecs})?')
+        self._segments: Dict[Month, _Segment] = {}
+        self._months: Dict[str, Month] = {}  # transaction id -> month of its segment
+        self._dir_stamp: Optional[Tuple[int, int]] = None
+    
+    def _segment_path(self, month: Month, suffix: Optional[str] = None) -> Path:
+        """Location of a new segment file for a month."""
+        return self.path / f"{month[0]:04d}-{month[1]:02d}{suffix or self.segment_suffix}"
+    
+    def _locate(self, month: Month) -> Optional[Path]:
+        """The existing segment file of a month, whichever codec it is stored with."""
+        cached = self._segments.get(month)
+        candidates = [cached.path] if cached is not None else []
+        candidates.append(self._segment_path(month))
+        for codec in ('',) + tuple(CODECS):
+            candidates.append(self._segment_path(month, self._segment_format + codec))
+        for path in candidates:
+            if path.exists():
+                return path
+        return None
+    
+    @staticmethod
+    def _segment_store(path: Path) -> JSONStorage:
+        """Snapshot backend that reads and writes one segment file."""
+        return open_storage(path)
+    
+    def _stat_dir(self) -> Tuple[int, int]:
+        """(inode, mtime) of the directory; any segment written or removed changes it."""
+        st = os.stat(self.path)
+        return st.st_ino, st.st_mtime_ns
+    
+    def months(self) -> List[Month]:
+        """The months that have a segment, oldest first."""
+        found = set()
+        for name in os.listdir(self.path):
+            match = self._pattern.fullmatch(name)
+            if match:
+                found.add((int(match.group(1)), int(match.group(2))))
+        return sorted(found)
+    
+    def _read_segment(self, month: Month) -> List[Transaction]:
+        """The transactions in a month's segment, from the cache while its file is unchanged."""
+        cached = self._segments.get(month)
+        if cached is not None and cached.frozen:
+            return cached.transactions
+        
+        path = self._locate(month)
+        try:
+            st = os.stat(path) if path is not None else None
+        except FileNotFoundError:
+            st = None
+        if st is None:
+            self._segments.pop(month, None)
+            return []
+        stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+        if cached is not None and cached.path == path and cached.stamp == stamp:
+            return cached.transactions
+        
+        transactions: List[Transaction] = []
+        store = self._segment_store(path)
+        try:
+            store._read_snapshot(transactions)
+        except (KeyError, TypeError, ValueError) as e:
+            aside = store._set_aside()
+            print(f"Error loading segment: {e}. The unreadable file was moved to {aside}; "
+                  f"{len(transactions)} transactions before the damage were recovered.")
+            self._segments.pop(month, None)
+            return transactions
+        self._segments[month] = _Segment(path, stamp, not st.st_mode & 0o222, transactions)
+        return transactions
+    
+    def _write_segment(self, month: Month, transactions: List[Transaction],
+                       suffix: Optional[str] = None) -> None:
+        """Replace a month's segment, removing the file once the month is empty."""
+        existing = self._locate(month)
+        path = self._segment_path(month, suffix)
+        if transactions:
+            self._segment_store(path)._write_snapshot(transactions, 0)
+            st = os.stat(path)
+            self._segments[month] = _Segment(path, (st.st_ino, st.st_size, st.st_mtime_ns), False, transactions)
+        else:
+            self._segments.pop(month, None)
+        if existing is not None and (existing != path or not transactions):
+            existing.unlink()
+    
+    def _check_writable(self, months) -> None:
+        """Refuse changes to frozen months before anything is written."""
+        for month in months:
+            path = self._locate(month)
+            try:
+                mode = os.stat(path).st_mode if path is not None else 0o200
+            except FileNotFoundError:
+                continue
+            if not mode & 0o222:
+                raise ValueError(f"{month[0]:04d}-{month[1]:02d} is frozen and cannot be changed")
+    
+    def check_changes(self, changes: List[Tuple[str, object]]) -> None:
+        """Refuse changes that touch a frozen month."""
+        months = set()
+        for op, value in changes:
+            transaction_id = value.id if op == 'add' else value
+            if op == 'add':
+                months.add((value.date.year, value.date.month))
+            if transaction_id in self._months:
+                months.add(self._months[transaction_id])
+        self._check_writable(months)
+    
+    def load(self) -> List[Transaction]:
+        """Load every segment, re-reading only those that changed since the last load."""
+        with self._file_lock:
+            self._dir_stamp = self._stat_dir()
+            months = self.months()
+            for month in set(self._segments) - set(months):
+                del self._segments[month]
+            
+            transactions: List[Transaction] = []
+            self._months = {}
+            for month in months:
+                segment = self._read_segment(month)
+                transactions.extend(segment)
+                for transaction in segment:
+                    self._months[transaction.id] = month
+            return transactions
+    
+    def changed(self) -> bool:
+        """Whether a segment was written or removed since this process last read or wrote."""
+        return self._stat_dir() != self._dir_stamp
+    
+    def external_changes(self) -> Optional[List[Tuple[str, object]]]:
+        """Ask for a reload when the directory changed; unchanged segments come from the cache."""
+        return None if self.changed() else []
+    
+    def save(self, transactions: List[Transaction], marker: Any = None) -> None:
+        """Rewrite the segments whose contents differ from ``transactions``."""
+        by_month: Dict[Month, List[Transaction]] = {}
+        for transaction in transactions:
+            by_month.setdefault((transaction.date.year, transaction.date.month), []).append(transaction)
+        
+        with self._file_lock:
+            existing = self.months()
+            changed = [month for month in set(existing) | set(by_month)
+                       if {t.id: t for t in by_month.get(month, [])}
+                       != {t.id: t for t in self._read_segment(month)}]
+            self._check_writable(changed)
+            for month in sorted(changed):
+                self._write_segment(month, by_month.get(month, []))
+            self._months = {t.id: month for month, segment in by_month.items() for t in segment}
+            self._dir_stamp = self._stat_dir()
+            if changed:
+                self._written()
+    
+    def commit(self, changes: List[Tuple[str, object]]) -> None:
+        """Apply the changes to the segments of the months they touch."""
+        with self._file_lock:
+            months = dict(self._months)
+            touched: Dict[Month, Dict[str, Optional[Transaction]]] = {}
+            for op, value in changes:
+                transaction_id = value.id if op == 'add' else value
+                old_month = months.pop(transaction_id, None)
+                if old_month is not None:
+                    touched.setdefault(old_month, {})[transaction_id] = None
+                if op == 'add':
+                    month = (value.date.year, value.date.month)
+                    touched.setdefault(month, {})[transaction_id] = value
+                    months[transaction_id] = month
+            
+            self._check_writable(touched)
+            for month, updates in sorted(touched.items()):
+                segment = {t.id: t for t in self._read_segment(month)}
+                for transaction_id, transaction in updates.items():
+                    segment.pop(transaction_id, None)
+                    if transaction is not None:
+                        segment[transaction_id] = transaction
+                self._write_segment(month, list(segment.values()))
+            self._months = months
+            self._dir_stamp = self._stat_dir()
+            if touched:
+                self._written()
+    
+    def _force_to_disk(self) -> None:
+        """Sync the directory entries of the rewritten segments."""
+        _fsync_directory(self.path / '.lock')  # syncs the directory holding the given file
+    
+    def freeze(self, year: int, month: int, codec: Optional[str] = None) -> None:
+        """Mark a month's segment read-only so it is cached for good and never changed.
+        
+        With ``codec`` (``'.gz'``, ``'.bz2'`` or ``'.xz'``) the segment is
+        first rewritten with that compression, for example to archive cold
+        months with a stronger codec than the live ones use.
+        """
+        if codec is not None and codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec!r}")
+        key = (year, month)
+        with self._file_lock:
+            path = self._locate(key)
+            if path is None:
+                raise FileNotFoundError(f"No segment for {year:04d}-{month:02d}")
+            if codec is not None:
+                self._check_writable([key])
+                self._write_segment(key, self._read_segment(key), self._segment_format + codec)
+                path = self._segments[key].path
+                self._dir_stamp = self._stat_dir()
+                self._written()
+            os.chmod(path, stat.S_IMODE(os.stat(path).st_mode) & ~0o222)
+            self._segments.pop(key, None)
+            self._read_segment(key)
+    
+    def _months_between(self, start_date: date, end_date: date) -> List[Month]:
+        """The months with a segment that overlap an inclusive date range."""
+        first = (start_date.year, start_date.month)
+        last = (end_date.year, end_date.month)
+        return [month for month in self.months() if first <= month <= last]
+    
+    def get_transactions_by_category(self, category: Category) -> List[Transaction]:
+        """Collect the transactions in a category from every segment, oldest month first."""
+        return [t for month in self.months() for t in self._read_segment(month) if t.category == category]
+    
+    def get_transactions_by_date_range(self, start_date: date, end_date: date) -> List[Transaction]:
+        """Read the overlapping segments for the transactions in a date range, oldest first."""
+        found = [t for month in self._months_between(start_date, end_date)
+                 for t in self._read_segment(month) if start_date <= t.date <= end_date]
+        found.sort(key=lambda t: (t.date, t.id))
+        return found
+    
+    def get_monthly_summary(self, start_date: date, end_date: date) -> Dict:
+        """Aggregate a date range by type and category from the overlapping segments."""
+        income = expenses = 0
+        count = 0
+        category_cents: Dict[str, int] = {}
+        for transaction in self.get_transactions_by_date_range(start_date, end_date):
+            count += 1
+            if transaction.transaction_type == TransactionType.INCOME:
+                income += transaction.amount_cents
+            else:
+                expenses += transaction.amount_cents
+                name = transaction.category.value
+                category_cents[name] = category_cents.get(name, 0) + transaction.amount_cents
+        
+        return {
+            'income': income / 100,
+            'expenses': expenses / 100,
+            'balance': (income - expenses) / 100,
+            'category_totals': {name: cents / 100 for name, cents in category_cents.items()},
+            'transaction_count': count
+        }
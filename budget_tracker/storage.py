@@ -0,0 +1,842 @@
+"""
+Storage backends: JSON snapshots with an optional journal, and SQLite.
+"""
+
+import atexit
+import importlib
+import json
+import os
+import re
+import threading
+import time
+import weakref
+from datetime import datetime, date
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .locks import FileLock
+from .models import (CATEGORY_BY_VALUE, TRANSACTION_TYPE_BY_VALUE, Category, Transaction,
+                     TransactionType, parse_date)
+
+# When to force written data to disk: after every write, at most every
+# ``sync_interval`` seconds, or only when the store is closed
+DURABILITY_POLICIES = ('always', 'interval', 'shutdown')
+
+# Stores whose deferred fsyncs are still outstanding are synced at exit
+_UNSYNCED_STORES = weakref.WeakSet()
+
+# Compression suffix -> standard library module whose open() streams the codec
+CODECS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'lzma'}
+
+
+def split_codec(path: Path) -> Tuple[str, Optional[str]]:
+    """Split a data file's suffix into its format and compression parts.
+    
+    ``budget_data.json.gz`` gives ``('.json', '.gz')`` and
+    ``budget_data.json`` gives ``('.json', None)``.
+    """
+    path = Path(path)
+    if path.suffix in CODECS:
+        return Path(path.stem).suffix, path.suffix
+    return path.suffix, None
+
+
+def _codec(path: Path):
+    """The compression module for a data file, or None if it is stored uncompressed."""
+    suffix = Path(path).suffix
+    return importlib.import_module(CODECS[suffix]) if suffix in CODECS else None
+
+
+def open_data(path: Path, mode: str = 'r') -> IO:
+    """Open a data file for reading, decompressing it as a stream if its suffix names a codec."""
+    codec = _codec(path)
+    if codec is None:
+        return open(path, mode)
+    return codec.open(path, mode if 'b' in mode else mode.replace('t', '') + 't')
+
+
+def _write_atomically(path: Path, write: Callable[[IO], None], mode: str = 'w',
+                      install: Optional[Callable[[Path], None]] = None) -> None:
+    """Write a file through a temporary file that is fsynced and swapped in with ``os.replace``.
+    
+    Readers and crashes see either the old file or the complete new one;
+    the fsync comes first so the rename can never expose unwritten data.
+    When ``path`` ends in a codec suffix, the data is compressed as it is
+    written. ``install``, if given, moves the finished temporary file into
+    place instead of the plain ``os.replace``.
+    """
+    # Per writer, so writers that do not hold the lock cannot clobber each other's file
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    codec = _codec(path)
+    with open(temp_file, 'wb' if codec is not None else mode) as f:
+        if codec is None:
+            write(f)
+        else:
+            with codec.open(f, mode if 'b' in mode else 'wt') as compressed:
+                write(compressed)
+        f.flush()
+        os.fsync(f.fileno())
+    if install is None:
+        os.replace(temp_file, path)
+    else:
+        install(temp_file)
+
+
+class _JSONStream:
+    """Reads consecutive JSON values from a text file a chunk at a time.
+    
+    Only the chunk being parsed is held in memory, so a large document
+    can be consumed value by value instead of being decoded in one piece.
+    """
+    
+    _decoder = json.JSONDecoder()
+    _whitespace = re.compile(r'[ \t\n\r]*')
+    
+    def __init__(self, f: IO, chunk_size: int = 1024 * 1024):
+        """Initialize the stream over an open text file."""
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._consumed = 0  # characters dropped from the front of the buffer
+    
+    def _fill(self) -> bool:
+        """Append the next chunk to the unparsed text; False at end of file."""
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            return False
+        self._consumed += self._pos
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or '' at end of file."""
+        while True:
+            self._pos = self._whitespace.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+    
+    def expect(self, char: str) -> None:
+        """Consume ``char`` as the next non-whitespace character."""
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} in JSON stream")
+        self._pos += 1
+    
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"{e.msg} (character {self._consumed + e.pos})") from e
+            # A number at the end of the chunk may continue in the next one
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+    
+    def items(self, close: str) -> Iterator[None]:
+        """Step through the members of an opened array or object until ``close``."""
+        if self.peek() == close:
+            self._pos += 1
+            return
+        while True:
+            yield
+            char = self.peek()
+            self._pos += 1
+            if char == close:
+                return
+            if char != ',':
+                raise ValueError(f"Expected ',' or {close!r} in JSON stream")
+
+
+def _scan_snapshot(f: IO) -> Iterator[Tuple[str, Any]]:
+    """Parse a snapshot incrementally, yielding ``(key, value)`` for each top-level field.
+    
+    The ``transactions`` array is not yielded whole: each of its rows
+    comes out on its own as ``('transaction', row)``.
+    """
+    stream = _JSONStream(f)
+    stream.expect('{')
+    for _ in stream.items('}'):
+        key = stream.value()
+        stream.expect(':')
+        if key == 'transactions':
+            stream.expect('[')
+            for _ in stream.items(']'):
+                yield 'transaction', stream.value()
+        else:
+            yield key, stream.value()
+
+
+def _fsync_directory(path: Path) -> None:
+    """Persist the directory entry of ``path`` so a rename or unlink survives a crash."""
+    try:
+        fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:  # Windows cannot open directories; its renames are durable already
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class TransactionJournal:
+    """Append-only log of transaction mutations, one JSON record per line.
+    
+    Every record carries an increasing sequence number so a snapshot can
+    state exactly which records it already contains.
+    """
+    
+    def __init__(self, path: Path):
+        """Initialize the journal at the given path."""
+        self.path = Path(path)
+        self.seq = 0
+        self.record_count = 0
+        self.size = 0
+        self.inode: Optional[int] = None
+    
+    def stamp(self) -> Optional[Tuple[int, int]]:
+        """(inode, size) of the log as this journal last read or wrote it."""
+        return None if self.inode is None else (self.inode, self.size)
+    
+    def stat(self) -> Optional[Tuple[int, int]]:
+        """(inode, size) of the log file on disk, or None if there is none."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size
+    
+    def append(self, op: str, payload: Dict, fsync: bool = False) -> None:
+        """Append a single mutation record to the log."""
+        self.extend([(op, payload)], fsync=fsync)
+    
+    def extend(self, records: List[Tuple[str, Dict]], fsync: bool = False) -> None:
+        """Append mutation records to the log in one write, fsyncing it if asked."""
+        lines = []
+        for op, payload in records:
+            self.seq += 1
+            lines.append(json.dumps({'seq': self.seq, 'op': op, **payload}, separators=(',', ':')) + '\n')
+        data = ''.join(lines).encode()
+        with open(self.path, 'a+b') as f:
+            self._drop_torn_tail(f)
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+            if self.inode is None:
+                self.inode = os.fstat(f.fileno()).st_ino
+            # Callers hold the store lock and have read every complete record
+            self.size = f.tell()
+        self.record_count += len(lines)
+    
+    @staticmethod
+    def _drop_torn_tail(f: IO[bytes]) -> None:
+        """Cut off a final line a killed writer left without its newline.
+        
+        The partial record was never acknowledged, and appending after it
+        would glue the next record onto the fragment and lose that too.
+        """
+        end = pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            start = max(0, pos - 4096)
+            f.seek(start)
+            chunk = f.read(pos - start)
+            if pos == end and chunk.endswith(b'\n'):
+                return
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                f.truncate(start + newline + 1)
+                return
+            pos = start
+        f.truncate(0)
+    
+    def sync(self) -> None:
+        """Force the records appended so far to disk."""
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def read_tail(self) -> Optional[List[Dict]]:
+        """Read the records other writers appended since this journal last read or wrote.
+        
+        Returns None if the log was replaced or truncated in the meantime,
+        in which case only a full replay gives the right ledger.
+        """
+        stat = self.stat()
+        if stat is None:
+            return None if self.inode is not None else []
+        inode, size = stat
+        if (self.inode is not None and inode != self.inode) or size < self.size:
+            return None
+        if size == self.size:
+            return []
+        
+        with open(self.path, 'rb') as f:
+            f.seek(self.size)
+            data = f.read(size - self.size)
+        end = data.rfind(b'\n') + 1  # leave a partial final line for the next read
+        records = []
+        for line in data[:end].splitlines():
+            if line.strip():
+                record = json.loads(line)
+                self.seq = max(self.seq, record.get('seq', 0))
+                records.append(record)
+        self.inode = inode
+        self.size += end
+        self.record_count += len(records)
+        return records
+    
+    def replay(self, after_seq: int = 0) -> Iterator[Dict]:
+        """Yield the records newer than ``after_seq``, oldest first."""
+        self.seq = max(self.seq, after_seq)
+        self.record_count = 0
+        stat = self.stat()
+        if stat is None:
+            self.inode = None
+            self.size = 0
+            return
+        
+        self.inode, self.size = stat
+        for record in self._read_records():
+            self.record_count += 1
+            seq = record.get('seq', 0)
+            self.seq = max(self.seq, seq)
+            if seq > after_seq or 'seq' not in record:
+                yield record
+    
+    def truncate_through(self, seq: int) -> None:
+        """Drop the records already folded into a snapshot taken at ``seq``."""
+        if not self.path.exists():
+            return
+        
+        tail = [r for r in self._read_records() if r.get('seq', 0) > seq]
+        if not tail:
+            self.clear()
+            return
+        
+        _write_atomically(self.path, lambda f: f.writelines(
+            json.dumps(record, separators=(',', ':')) + '\n' for record in tail))
+        self.record_count = len(tail)
+        self.inode, self.size = self.stat()
+    
+    def clear(self) -> None:
+        """Discard all records once they are folded into a snapshot."""
+        if self.path.exists():
+            self.path.unlink()
+        self.record_count = 0
+        self.size = 0
+        self.inode = None
+    
+    def _read_records(self) -> Iterator[Dict]:
+        """Yield every readable record in the log file."""
+        with open(self.path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append is ignored
+                    print(f"Skipping unreadable journal record in {self.path}")
+
+
+class Storage:
+    """Base class for pluggable transaction persistence backends.
+    
+    A backend always supports loading and saving the full ledger. Backends
+    that set ``incremental`` can also persist individual changes through
+    ``commit``, and backends that set ``supports_queries`` answer the
+    tracker's lookup and reporting queries themselves. Backends that set
+    ``unlocked_save`` keep the changes committed after ``save``'s marker,
+    so a snapshot can be written without holding the lock throughout.
+    
+    Several processes may share one store. Writers hold ``lock()`` while
+    they apply and persist a change, and readers call ``changed()`` to
+    notice writes made by other processes.
+    
+    ``durability`` decides when file-based backends force their writes to
+    disk: after every write (``'always'``), at most ``sync_interval``
+    seconds later (``'interval'``), or only on ``sync()`` and at exit
+    (``'shutdown'``). Deferring trades the last moments of work on a power
+    failure for cheaper writes; a killed process loses nothing either way.
+    """
+    
+    incremental = False
+    supports_queries = False
+    unlocked_save = False
+    
+    def __init__(self, lock_path: Optional[Path] = None, durability: str = 'always',
+                 sync_interval: float = 0.1):
+        """Initialize the write lock, taken on ``lock_path`` if one is given."""
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(f"Unknown durability policy: {durability!r}")
+        self._file_lock = FileLock(lock_path)
+        self.durability = durability
+        self.sync_interval = sync_interval
+        self._unsynced = False
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+    
+    def lock(self) -> FileLock:
+        """Return the reentrant lock writers hold while changing the store."""
+        return self._file_lock
+    
+    def changed(self) -> bool:
+        """Cheaply check whether another process wrote since this one last read or wrote."""
+        return False
+    
+    def external_changes(self) -> Optional[List[Tuple[str, object]]]:
+        """Read the changes other processes wrote since this one last read or wrote.
+        
+        Call with ``lock()`` held. Returns the changes in ``commit`` form,
+        or None when the ledger has to be reloaded with ``load``.
+        """
+        return []
+    
+    def _written(self) -> None:
+        """Apply the durability policy after a write: sync now, or note the sync owed."""
+        if self.durability == 'always':
+            self._force_to_disk()
+            return
+        self._unsynced = True
+        _UNSYNCED_STORES.add(self)
+        if self.durability != 'interval':
+            return
+        delay = self._last_sync + self.sync_interval - time.monotonic()
+        if delay <= 0:
+            self.sync()
+        elif self._sync_timer is None:
+            self._sync_timer = threading.Timer(delay, self.sync)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+    
+    def _force_to_disk(self) -> None:
+        """Force the writes made since the last sync to disk."""
+    
+    def sync(self) -> None:
+        """Force writes the durability policy deferred to disk."""
+        with self._file_lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._unsynced:
+                self._force_to_disk()
+                self._unsynced = False
+            self._last_sync = time.monotonic()
+        _UNSYNCED_STORES.discard(self)
+    
+    def load(self) -> List[Transaction]:
+        """Load every stored transaction."""
+        raise NotImplementedError
+    
+    def save(self, transactions: List[Transaction], marker: Any = None) -> None:
+        """Replace the stored ledger with ``transactions``.
+        
+        ``marker`` is the value ``marker()`` returned when the list was copied;
+        changes committed after it are kept.
+        """
+        raise NotImplementedError
+    
+    def commit(self, changes: List[Tuple[str, object]]) -> None:
+        """Persist ``('add', transaction)`` and ``('remove', id)`` changes."""
+        raise NotImplementedError
+    
+    def check_changes(self, changes: List[Tuple[str, object]]) -> None:
+        """Raise ValueError if the store would refuse the changes for good.
+        
+        Callers that write later, such as the write-behind queue, check
+        first so a change that can never be written is not queued.
+        """
+    
+    def marker(self) -> Any:
+        """Return a token identifying the changes committed so far."""
+        return None
+    
+    def needs_compaction(self) -> bool:
+        """Whether incremental changes should be folded into a new snapshot."""
+        return False
+
+
+class JSONStorage(Storage):
+    """JSON snapshot file with an optional append-only mutation journal.
+    
+    Snapshots are always written crash-safely; the durability policy
+    decides when journal appends and snapshot renames reach the disk.
+    """
+    
+    def __init__(self, path: Path, journaled: bool = False,
+                 compact_after_records: int = 10000, compact_after_bytes: int = 8 * 1024 * 1024,
+                 durability: str = 'always', sync_interval: float = 0.1):
+        """Initialize JSON storage at the given path."""
+        self.path = Path(path)
+        super().__init__(self.path.with_name(self.path.name + '.lock'), durability, sync_interval)
+        self.incremental = self.unlocked_save = journaled
+        self.journal = TransactionJournal(self.path.with_name(self.path.name + '.journal'))
+        self.compact_after_records = compact_after_records
+        self.compact_after_bytes = compact_after_bytes
+        self._snapshot_stamp: Optional[Tuple[int, int, int]] = None
+    
+    def _stat_snapshot(self) -> Optional[Tuple[int, int, int]]:
+        """(inode, size, mtime) of the snapshot file, or None if there is none."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+    
+    @staticmethod
+    def _change(record: Dict) -> Tuple[str, object]:
+        """Convert a journal record to a change in ``commit`` form."""
+        if record['op'] == 'add':
+            return 'add', Transaction.from_dict(record['transaction'])
+        return 'remove', record['id']
+    
+    def _read_snapshot(self, transactions: List[Transaction]) -> int:
+        """Append the snapshot's transactions to ``transactions`` and return its journal sequence.
+        
+        The snapshot is parsed as a stream, so rows become transactions as
+        they are read and the decoded document is never held in full.
+        """
+        snapshot_seq = 0
+        with open_data(self.path) as f:
+            for key, value in _scan_snapshot(f):
+                if key == 'transaction':
+                    transactions.append(Transaction.from_dict(value))
+                elif key == 'journal_seq':
+                    snapshot_seq = value
+        return snapshot_seq
+    
+    def _write_snapshot(self, transactions: List[Transaction], marker: int,
+                        install: Optional[Callable[[Path], None]] = None) -> None:
+        """Write the snapshot file atomically; ``install`` goes to ``_write_atomically``."""
+        data = {
+            'transactions': [t.to_dict() for t in transactions],
+            'journal_seq': marker,
+            'last_updated': datetime.now().isoformat()
+        }
+        _write_atomically(self.path, lambda f: json.dump(data, f, indent=2), install=install)
+    
+    def load(self) -> List[Transaction]:
+        """Load the snapshot and replay the journaled changes newer than it."""
+        with self._file_lock:
+            self._snapshot_stamp = self._stat_snapshot()
+            transactions: List[Transaction] = []
+            snapshot_seq = 0
+            if self._snapshot_stamp is not None:
+                try:
+                    snapshot_seq = self._read_snapshot(transactions)
+                except (KeyError, TypeError, ValueError) as e:
+                    # Never let the next save overwrite what may still be recoverable;
+                    # the rows read before the damage are kept
+                    aside = self._set_aside()
+                    print(f"Error loading data: {e}. The unreadable file was moved to {aside}; "
+                          f"{len(transactions)} transactions before the damage were recovered.")
+                    snapshot_seq = 0
+            
+            ledger = {t.id: t for t in transactions}
+            try:
+                for record in self.journal.replay(after_seq=snapshot_seq):
+                    op, value = self._change(record)
+                    if op == 'add':
+                        ledger[value.id] = value
+                    else:
+                        ledger.pop(value, None)
+            except (KeyError, ValueError) as e:
+                print(f"Error replaying journal: {e}")
+            return list(ledger.values())
+    
+    def _set_aside(self) -> Path:
+        """Rename an unreadable snapshot to a ``.corrupt-<timestamp>`` file beside it."""
+        aside = self.path.with_name(f"{self.path.name}.corrupt-{datetime.now():%Y%m%d-%H%M%S}")
+        os.replace(self.path, aside)
+        self._snapshot_stamp = None
+        return aside
+    
+    def changed(self) -> bool:
+        """Whether the snapshot was replaced or the journal grew behind our back."""
+        return (self._stat_snapshot() != self._snapshot_stamp
+                or self.journal.stat() != self.journal.stamp())
+    
+    def external_changes(self) -> Optional[List[Tuple[str, object]]]:
+        """Read the journal records other processes appended since we last looked.
+        
+        A replaced snapshot or rewritten journal means another process
+        compacted, so the whole ledger has to be reloaded.
+        """
+        if self._stat_snapshot() != self._snapshot_stamp:
+            return None
+        try:
+            records = self.journal.read_tail()
+            return None if records is None else [self._change(r) for r in records]
+        except (KeyError, ValueError) as e:
+            print(f"Error reading journal: {e}")
+            return None
+    
+    def save(self, transactions: List[Transaction], marker: Any = None) -> None:
+        """Write a snapshot atomically and drop the journal records it covers.
+        
+        The snapshot is written to a temporary file, fsynced and swapped in
+        with ``os.replace``. It records the last journal sequence number it
+        includes, so a crash before the journal is trimmed is harmless.
+        
+        With a journal, the lock is only taken to swap the file in, so
+        writers can keep appending while the snapshot is serialized; their
+        records are newer than ``marker`` and stay in the journal. If another
+        writer replaced the snapshot since ``marker`` was taken, this one is
+        dropped: that snapshot and the journal already hold every change.
+        """
+        if marker is None:
+            with self._file_lock:
+                marker = self.journal.seq, self._stat_snapshot()
+        seq, expected = marker
+        
+        def install(temp_file: Path) -> None:
+            with self._file_lock:
+                if self._stat_snapshot() != expected:
+                    os.remove(temp_file)
+                    return
+                caught_up = self.journal.stat() == self.journal.stamp()
+                os.replace(temp_file, self.path)
+                self.journal.truncate_through(seq)
+                # Records other processes appended meanwhile were never read here;
+                # a stale stamp makes the next check reload them
+                self._snapshot_stamp = self._stat_snapshot() if caught_up else None
+                self._written()
+        
+        if self.unlocked_save:
+            self._write_snapshot(transactions, seq, install)
+        else:
+            with self._file_lock:
+                self._write_snapshot(transactions, seq, install)
+    
+    def commit(self, changes: List[Tuple[str, object]]) -> None:
+        """Append the changes to the journal."""
+        records = [('add', {'transaction': value.to_dict()}) if op == 'add' else ('remove', {'id': value})
+                   for op, value in changes]
+        with self._file_lock:
+            if self.durability == 'always' and self.journal.inode is not None:
+                # Appending to an existing log only needs the log itself synced
+                self.journal.extend(records, fsync=True)
+            else:
+                self.journal.extend(records)
+                self._written()
+    
+    def _force_to_disk(self) -> None:
+        """Sync the journal's appends and the directory entries of renamed files."""
+        self.journal.sync()
+        _fsync_directory(self.path)
+    
+    def marker(self) -> Tuple[int, Optional[Tuple[int, int, int]]]:
+        """Return the sequence number of the newest journal record and the snapshot it follows."""
+        return self.journal.seq, self._snapshot_stamp
+    
+    def needs_compaction(self) -> bool:
+        """Whether the journal has passed either compaction threshold."""
+        return (self.journal.record_count >= self.compact_after_records
+                or self.journal.size >= self.compact_after_bytes)
+
+
+class SQLiteStorage(Storage):
+    """SQLite database with indexes for pushing queries down to SQL."""
+    
+    incremental = True
+    supports_queries = True
+    
+    COLUMNS = 'id, name, amount, category, transaction_type, date, description, tags'
+    
+    def __init__(self, path: Path, durability: str = 'always'):
+        """Open (and if needed create) the database at the given path.
+        
+        ``durability='always'`` keeps SQLite's default of syncing every
+        commit; the deferred policies relax it to ``synchronous=NORMAL``.
+        """
+        import sqlite3
+        
+        self.path = Path(path)
+        # SQLite itself keeps writers in separate processes apart and syncs its own files
+        super().__init__(durability=durability)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._data_version: Optional[int] = None
+        with self._lock, self._conn:
+            self._conn.execute(f"PRAGMA synchronous = {'FULL' if durability == 'always' else 'NORMAL'}")
+            self._conn.executescript('''
+                CREATE TABLE IF NOT EXISTS transactions (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    category TEXT NOT NULL,
+                    transaction_type TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    description TEXT,
+                    tags TEXT NOT NULL DEFAULT '[]'
+                );
+                CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date);
+                CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions (category, date);
+                CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions (transaction_type, date);
+            ''')
+    
+    @staticmethod
+    def _to_row(transaction: Transaction) -> Tuple:
+        """Convert a transaction to a table row."""
+        return (transaction.id, transaction.name, transaction.amount,
+                transaction.category.value, transaction.transaction_type.value,
+                transaction.date.isoformat(), transaction.description,
+                json.dumps(list(transaction.tags)))
+    
+    @staticmethod
+    def _from_row(row: Tuple) -> Transaction:
+        """Create a transaction from a table row."""
+        return Transaction(
+            id=row[0],
+            name=row[1],
+            amount=row[2],
+            category=CATEGORY_BY_VALUE[row[3]],
+            transaction_type=TRANSACTION_TYPE_BY_VALUE[row[4]],
+            date=parse_date(row[5]),
+            description=row[6],
+            tags=json.loads(row[7])
+        )
+    
+    def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Run a read query and return all rows."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+    
+    def _read_data_version(self) -> int:
+        """Read SQLite's counter of commits made through other connections."""
+        return self._query("PRAGMA data_version")[0][0]
+    
+    def load(self) -> List[Transaction]:
+        """Load every stored transaction in insertion order."""
+        self._data_version = self._read_data_version()
+        rows = self._query(f"SELECT {self.COLUMNS} FROM transactions ORDER BY rowid")
+        return [self._from_row(row) for row in rows]
+    
+    def changed(self) -> bool:
+        """Whether another connection committed since the last load."""
+        return self._read_data_version() != self._data_version
+    
+    def external_changes(self) -> Optional[List[Tuple[str, object]]]:
+        """Ask for a reload when another connection committed; the table keeps no change log."""
+        return None if self.changed() else []
+    
+    def save(self, transactions: List[Transaction], marker: Any = None) -> None:
+        """Replace every stored row in a single database transaction."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM transactions")
+            self._conn.executemany(
+                f"INSERT INTO transactions ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._to_row(t) for t in transactions))
+    
+    def commit(self, changes: List[Tuple[str, object]]) -> None:
+        """Insert and delete the changed rows in a single database transaction."""
+        with self._lock, self._conn:
+            for op, value in changes:
+                if op == 'add':
+                    self._conn.execute(
+                        f"INSERT OR REPLACE INTO transactions ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        self._to_row(value))
+                else:
+                    self._conn.execute("DELETE FROM transactions WHERE id = ?", (value,))
+    
+    def get_transactions_by_category(self, category: Category) -> List[Transaction]:
+        """Select the transactions in a category through the category index."""
+        rows = self._query(f"SELECT {self.COLUMNS} FROM transactions WHERE category = ? ORDER BY rowid",
+                           (category.value,))
+        return [self._from_row(row) for row in rows]
+    
+    def get_transactions_by_date_range(self, start_date: date, end_date: date) -> List[Transaction]:
+        """Select the transactions in a date range through the date index, oldest first."""
+        rows = self._query(f"SELECT {self.COLUMNS} FROM transactions WHERE date BETWEEN ? AND ? ORDER BY date, id",
+                           (start_date.isoformat(), end_date.isoformat()))
+        return [self._from_row(row) for row in rows]
+    
+    def get_monthly_summary(self, start_date: date, end_date: date) -> Dict:
+        """Aggregate a date range by type and category in SQL."""
+        # Amounts are stored in dollars; summing them as whole cents keeps the totals exact
+        rows = self._query(
+            "SELECT transaction_type, category, CAST(TOTAL(ROUND(amount * 100)) AS INTEGER), COUNT(*) "
+            "FROM transactions "
+            "WHERE date BETWEEN ? AND ? GROUP BY transaction_type, category",
+            (start_date.isoformat(), end_date.isoformat()))
+        
+        income = expenses = 0
+        count = 0
+        category_totals = {}
+        for transaction_type, category, cents, rows_in_group in rows:
+            count += rows_in_group
+            if transaction_type == TransactionType.INCOME.value:
+                income += cents
+            else:
+                expenses += cents
+                category_totals[category] = cents / 100
+        
+        return {
+            'income': income / 100,
+            'expenses': expenses / 100,
+            'balance': (income - expenses) / 100,
+            'category_totals': category_totals,
+            'transaction_count': count
+        }
+
+
+def open_storage(data_file: Path, journaled: bool = False, durability: str = 'always',
+                 partitioned: bool = False, **options) -> Storage:
+    """Pick a storage backend from the data file's extension.
+    
+    A directory, or any path when ``partitioned`` is set, holds one segment
+    file per month (``segment_suffix`` in ``options`` picks their format). A
+    ``.gz``, ``.bz2`` or ``.xz`` suffix after the format
+    (``budget_data.json.gz``) compresses the snapshot with that codec.
+    """
+    if partitioned or Path(data_file).is_dir():
+        from .partitions import PartitionedStorage
+        return PartitionedStorage(data_file, segment_suffix=options.get('segment_suffix', '.json'),
+                                  durability=durability, sync_interval=options.get('sync_interval', 0.1))
+    suffix, codec = split_codec(data_file)
+    if suffix in ('.db', '.sqlite', '.sqlite3'):
+        if codec is not None:
+            raise ValueError("SQLite databases cannot be compressed")
+        return SQLiteStorage(data_file, durability=durability)
+    if suffix == '.bin':
+        from .binary import BinaryStorage
+        return BinaryStorage(data_file, journaled=journaled, durability=durability, **options)
+    return JSONStorage(data_file, journaled=journaled, durability=durability, **options)
+
+
+def convert_storage(source: Path, target: Path, **options) -> int:
+    """Copy a ledger into a new data file, converting between formats by extension.
+    
+    For example ``convert_storage('budget_data.json', 'budget_data.bin')``
+    and back. Journaled changes in the source are included. Returns the
+    number of transactions copied; an existing target is never overwritten.
+    ``options`` go to ``open_storage`` for the target, for example
+    ``partitioned=True`` to split a ledger into monthly segments.
+    """
+    if Path(target).exists():
+        raise FileExistsError(f"{target} already exists")
+    transactions = open_storage(source).load()
+    open_storage(target, **options).save(transactions)
+    return len(transactions)
+
+
+@atexit.register
+def _sync_unsynced_stores() -> None:
+    """Force the writes still deferred by a durability policy to disk at exit."""
+    for store in list(_UNSYNCED_STORES):
+        store.sync()
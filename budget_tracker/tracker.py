@@ -0,0 +1,893 @@
+"""
+The BudgetTracker: in-memory indexes over the ledger, persistence,
+queries, and CSV import/export.
+"""
+
+import base64
+import locale
+import threading
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .analytics import ColumnarLedger
+from .locks import ReadWriteLock
+from .models import Category, Transaction, TransactionType
+from .storage import Storage, open_storage
+from .writer import WriteBehindQueue
+
+
+# Page size bounds for cursor-based listing
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Column layout shared by CSV export and import
+CSV_FIELDNAMES = ['ID', 'Name', 'Amount', 'Category', 'Type', 'Date', 'Description', 'Tags']
+
+
+@dataclass
+class ImportReport:
+    """Progress and outcome of a CSV import."""
+    rows_read: int = 0
+    imported: int = 0
+    chunks_committed: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+
+class BudgetTracker:
+    """Main budget tracking application class."""
+    
+    def __init__(self, data_file: str = "budget_data.json", journaled: bool = False,
+                 compact_after_records: int = 10000, compact_after_bytes: int = 8 * 1024 * 1024,
+                 storage: Optional[Storage] = None, debug: bool = False,
+                 write_behind: bool = False, max_write_delay: float = 0.05,
+                 durability: str = 'always', sync_interval: float = 0.1, partitioned: bool = False):
+        """Initialize the budget tracker.
+        
+        The storage backend is chosen from the data file's extension unless
+        one is passed in: ``.db``/``.sqlite`` files use SQLite, ``.bin`` files
+        the binary format, anything else a JSON snapshot. With ``partitioned``
+        set (or when ``data_file`` is a directory), the ledger is kept in one
+        segment file per month. When ``journaled`` is set, JSON storage
+        appends adds and removals to a small log instead of rewriting the
+        whole ledger, and folds the log into a fresh snapshot on a background
+        thread once it passes either compaction threshold. With ``debug`` set, the running
+        totals are checked against a full recompute on every read.
+        
+        With ``write_behind`` set, changes are applied in memory and handed
+        to a background writer, which persists everything queued within
+        ``max_write_delay`` seconds in one write. Call ``flush()`` to wait
+        for durability; queued changes are also written at exit.
+        
+        ``durability`` sets when writes are forced to disk: ``'always'``
+        (every write), ``'interval'`` (at most ``sync_interval`` seconds
+        later) or ``'shutdown'`` (on ``flush()``, ``close()`` and at exit).
+        """
+        self.data_file = Path(data_file)
+        self.debug = debug
+        if storage is None:
+            storage = open_storage(self.data_file, journaled=journaled, durability=durability,
+                                   partitioned=partitioned,
+                                   compact_after_records=compact_after_records,
+                                   compact_after_bytes=compact_after_bytes,
+                                   sync_interval=sync_interval)
+        self.storage = storage
+        self._transactions: List[Transaction] = []
+        self._positions: Dict[str, int] = {}
+        self._date_keys: List[Tuple[int, str]] = []
+        self._by_date: List[Transaction] = []
+        self._totals: Dict[TransactionType, int] = {t: 0 for t in TransactionType}
+        self._rollup: Dict[Tuple[int, int], Dict[Tuple[Category, TransactionType], List]] = {}
+        self._version = 0
+        self._columnar: Optional[Tuple[int, ColumnarLedger]] = None
+        self._lock = ReadWriteLock()
+        self._writer_lock = threading.RLock()  # serializes mutations and whole batches
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._batch_depth = 0
+        self._batch_changes: List[Tuple[str, object]] = []
+        self._batch_undo: List[Tuple[str, Optional[Transaction]]] = []
+        self._own_writes = 0  # nesting depth of this process's writes in progress
+        self._write_behind: Optional[WriteBehindQueue] = None
+        self.load_data()
+        if write_behind:
+            self._write_behind = WriteBehindQueue(self._write_queued, max_write_delay)
+        
+        # Set locale for currency formatting
+        try:
+            locale.setlocale(locale.LC_ALL, '')
+        except locale.Error:
+            locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
+    
+    @property
+    def transactions(self) -> List[Transaction]:
+        """All transactions, in no particular order."""
+        self._sync()
+        return self._transactions
+    
+    @transactions.setter
+    def transactions(self, transactions: List[Transaction]) -> None:
+        """Replace the in-memory ledger and rebuild its indexes."""
+        transactions = list(transactions)
+        with self._writer_lock, self.storage.lock(), self._lock.write():
+            self._transactions = transactions
+            self._rebuild_indexes()
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild every in-memory index from the transaction list."""
+        self._version += 1
+        self._positions = {t.id: i for i, t in enumerate(self._transactions)}
+        self._by_date = sorted(self._transactions, key=self._date_key)
+        self._date_keys = [self._date_key(t) for t in self._by_date]
+        self._totals = self._compute_totals()
+        self._rollup = {}
+        for transaction in self._transactions:
+            self._update_rollup(transaction, 1)
+    
+    def _update_rollup(self, transaction: Transaction, sign: int) -> None:
+        """Add (sign 1) or subtract (sign -1) a transaction in the monthly rollup.
+        
+        The rollup maps (year, month) to a [total cents, count] cell per
+        (category, transaction type); empty cells are dropped.
+        """
+        month_key = (transaction.date.year, transaction.date.month)
+        cell_key = (transaction.category, transaction.transaction_type)
+        cells = self._rollup.setdefault(month_key, {})
+        cell = cells.setdefault(cell_key, [0, 0])
+        cell[0] += sign * transaction.amount_cents
+        cell[1] += sign
+        if cell[1] == 0:
+            del cells[cell_key]
+            if not cells:
+                del self._rollup[month_key]
+    
+    def _compute_totals(self) -> Dict[TransactionType, int]:
+        """Sum the amounts in cents of every transaction per type with a full pass."""
+        totals = {t: 0 for t in TransactionType}
+        for transaction in self._transactions:
+            totals[transaction.transaction_type] += transaction.amount_cents
+        return totals
+    
+    def verify_totals(self) -> None:
+        """Check the running totals against a full recompute."""
+        with self._lock.read():
+            expected = self._compute_totals()
+            for transaction_type, total in expected.items():
+                if self._totals[transaction_type] != total:
+                    raise AssertionError(f"Running {transaction_type.value} total "
+                                         f"{self._totals[transaction_type]} != {total}")
+    
+    @staticmethod
+    def _date_key(transaction: Transaction) -> Tuple[int, str]:
+        """Sort key for the date index: date ordinal, then id."""
+        return (transaction.date.toordinal(), transaction.id)
+    
+    def _apply_add(self, transaction: Transaction) -> None:
+        """Add a transaction to the in-memory ledger and its indexes."""
+        self._version += 1
+        self._positions[transaction.id] = len(self._transactions)
+        self._transactions.append(transaction)
+        
+        key = self._date_key(transaction)
+        i = bisect_right(self._date_keys, key)
+        self._date_keys.insert(i, key)
+        self._by_date.insert(i, transaction)
+        
+        self._totals[transaction.transaction_type] += transaction.amount_cents
+        self._update_rollup(transaction, 1)
+    
+    def _apply_remove(self, transaction_id: str) -> Optional[Transaction]:
+        """Remove a transaction from the in-memory ledger and its indexes.
+        
+        The last transaction is moved into the freed slot, so nothing after
+        it has to shift.
+        """
+        position = self._positions.pop(transaction_id, None)
+        if position is None:
+            return None
+        
+        self._version += 1
+        removed = self._transactions[position]
+        last = self._transactions.pop()
+        if last is not removed:
+            self._transactions[position] = last
+            self._positions[last.id] = position
+        
+        i = bisect_left(self._date_keys, self._date_key(removed))
+        del self._date_keys[i]
+        del self._by_date[i]
+        
+        self._totals[removed.transaction_type] -= removed.amount_cents
+        self._update_rollup(removed, -1)
+        return removed
+    
+    def generate_id(self) -> str:
+        """Generate a unique ID for transactions."""
+        import uuid
+        transaction_id = str(uuid.uuid4())[:8]
+        while transaction_id in self._positions:
+            transaction_id = str(uuid.uuid4())[:8]
+        return transaction_id
+    
+    def _build_transaction(self, name: str, amount: float, category: Category,
+                           transaction_type: TransactionType, description: Optional[str] = None,
+                           tags: Optional[List[str]] = None, transaction_date: Optional[date] = None,
+                           transaction_id: Optional[str] = None) -> Transaction:
+        """Validate the fields of a new transaction and create it."""
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
+        
+        if transaction_date is None:
+            transaction_date = date.today()
+        
+        return Transaction(
+            id=transaction_id or self.generate_id(),
+            name=name,
+            amount=amount,
+            category=category,
+            transaction_type=transaction_type,
+            date=transaction_date,
+            description=description,
+            tags=tags or []
+        )
+    
+    def add_transaction(self, name: str, amount: float, category: Category,
+                       transaction_type: TransactionType, description: Optional[str] = None,
+                       tags: Optional[List[str]] = None, transaction_date: Optional[date] = None) -> Transaction:
+        """Add a new transaction to the tracker."""
+        transaction = self._build_transaction(name, amount, category, transaction_type,
+                                              description, tags, transaction_date)
+        
+        with self._writer_lock, self._storage_guard():
+            self._sync()
+            self._record_changes([('add', transaction)])
+            self._persist()
+        return transaction
+    
+    def add_transactions(self, rows: Iterable[Union[Transaction, Dict]]) -> List[Transaction]:
+        """Add many transactions and persist them once.
+        
+        Each row is either a ``Transaction`` or a dict of ``add_transaction``
+        keyword arguments. Every row is validated before any is applied, so
+        a single invalid row leaves the tracker unchanged.
+        """
+        transactions = []
+        seen_ids = set()
+        for i, row in enumerate(rows):
+            if isinstance(row, Transaction):
+                transaction = row
+                if transaction.amount_cents <= 0:
+                    raise ValueError(f"Row {i}: Amount must be positive")
+            else:
+                try:
+                    transaction = self._build_transaction(**row)
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Row {i}: {e}") from e
+            
+            if transaction.id in seen_ids:
+                raise ValueError(f"Row {i}: Duplicate transaction ID {transaction.id}")
+            seen_ids.add(transaction.id)
+            transactions.append(transaction)
+        
+        if not transactions:
+            return transactions
+        
+        with self._writer_lock, self._storage_guard():
+            self._sync()
+            for i, transaction in enumerate(transactions):
+                if transaction.id in self._positions:
+                    raise ValueError(f"Row {i}: Duplicate transaction ID {transaction.id}")
+            
+            self._record_changes([('add', t) for t in transactions])
+            self._persist()
+        return transactions
+    
+    def remove_transaction(self, transaction_id: str) -> bool:
+        """Remove a transaction by ID."""
+        with self._writer_lock, self._storage_guard():
+            self._sync()
+            if transaction_id not in self._positions:
+                return False
+            self._record_changes([('remove', transaction_id)])
+            self._persist()
+        return True
+    
+    @contextmanager
+    def batch(self):
+        """Group changes so they are persisted once, all or nothing.
+        
+        Adds and removals inside the block update the in-memory ledger
+        immediately but are only written when the outermost block exits.
+        If the block raises, its changes are rolled back and nothing is
+        written; a nested block that raises rolls back only its own
+        changes, and the enclosing block may catch the error and go on.
+        Other threads can read throughout, but their changes (and those of
+        other processes sharing the store) wait until the block exits.
+        """
+        with self._writer_lock, self._storage_guard():
+            self._sync()
+            self._batch_depth += 1
+            start = len(self._batch_changes)
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                self._rollback_batch(start)
+                raise
+            
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                changes, undo = self._batch_changes, self._batch_undo
+                self._batch_changes, self._batch_undo = [], []
+                if changes:
+                    self._commit_or_undo(changes, undo)
+                    self._persist()
+    
+    def _record_changes(self, changes: List[Tuple[str, object]]) -> None:
+        """Apply changes in memory and commit them, or hold them for the open batch.
+        
+        A synchronous commit reaches the store before the change is applied,
+        outside the read/write lock, so queries never wait on disk: they see
+        the ledger from before the change until it is durable. Batched and
+        queued changes are applied at once and written later.
+        """
+        if self._batch_depth or self._write_behind is not None:
+            # Refuse up front what the store could never write later
+            self.storage.check_changes(changes)
+        if self._batch_depth:
+            with self._lock.write():
+                self._batch_undo.extend(self._apply_changes(changes))
+                self._batch_changes.extend(changes)
+        elif self._write_behind is not None:
+            with self._lock.write():
+                self._apply_changes(changes)
+                self._write_behind.put(changes)
+        else:
+            if self.storage.incremental:
+                with self._own_write():
+                    self.storage.commit(changes)
+            with self._lock.write():
+                self._apply_changes(changes)
+    
+    def _apply_changes(self, changes: List[Tuple[str, object]]) -> List[Tuple[str, Optional[Transaction]]]:
+        """Apply changes in memory and return their undo log; call with the write lock held.
+        
+        The log has one entry per change, holding None for a removal of an
+        id that was already gone.
+        """
+        undo = []
+        for op, value in changes:
+            if op == 'add':
+                self._apply_add(value)
+                undo.append((op, value))
+            else:
+                undo.append((op, self._apply_remove(value)))
+        return undo
+    
+    def _commit_or_undo(self, changes: List[Tuple[str, object]],
+                        undo: List[Tuple[str, Optional[Transaction]]]) -> None:
+        """Commit changes already applied in memory, reverting them if the store refuses."""
+        try:
+            if self._write_behind is not None:
+                self._write_behind.put(changes)
+            elif self.storage.incremental:
+                with self._own_write():
+                    self.storage.commit(changes)
+        except Exception:
+            with self._lock.write():
+                self._undo(undo)
+            raise
+    
+    @contextmanager
+    def _own_write(self):
+        """Mark a write of this process's own changes, made with the storage lock held.
+        
+        Other processes are locked out until it ends, so anything ``changed()``
+        reports meanwhile is that write; ``_sync`` skips the check rather than
+        making readers wait for it on the storage lock.
+        """
+        self._own_writes += 1
+        try:
+            yield
+        finally:
+            self._own_writes -= 1
+    
+    def _storage_guard(self):
+        """Lock to hold while applying a change.
+        
+        Synchronous writes hold the storage lock from catching up with
+        other processes until the change is persisted. Queued writes take
+        it only on the background writer, so callers never wait on disk.
+        """
+        return nullcontext() if self._write_behind is not None else self.storage.lock()
+    
+    def _undo(self, undo: List[Tuple[str, Optional[Transaction]]]) -> None:
+        """Revert applied changes in memory, newest first; call with the write lock held."""
+        for op, transaction in reversed(undo):
+            if transaction is None:
+                continue
+            if op == 'add':
+                self._apply_remove(transaction.id)
+            else:
+                self._apply_add(transaction)
+    
+    def _rollback_batch(self, start: int = 0) -> None:
+        """Undo the in-memory changes a failed batch made after its first ``start`` changes."""
+        with self._lock.write():
+            self._undo(self._batch_undo[start:])
+            del self._batch_changes[start:]
+            del self._batch_undo[start:]
+    
+    def _sync(self) -> None:
+        """Apply the changes other processes wrote to the store since we last looked.
+        
+        The check is a stat of the data files (or a PRAGMA for SQLite), so
+        it runs before every read. Appended journal records are applied
+        incrementally; anything else reloads the ledger.
+        """
+        if self.storage.changed() and not self._own_writes:
+            with self.storage.lock():
+                self._sync_locked()
+    
+    def _sync_locked(self) -> None:
+        """Like ``_sync``, for callers already holding the storage lock."""
+        if not self.storage.changed():
+            return
+        changes = self.storage.external_changes()
+        if changes == []:
+            return
+        
+        with self._lock.write():
+            if changes is None:
+                self._transactions = self.storage.load()
+                self._rebuild_indexes()
+                # Changes not yet written by this process survive the reload
+                changes = self._batch_changes[:]
+                if self._write_behind is not None:
+                    changes = self._write_behind.pending() + changes
+            for op, value in changes:
+                if op == 'add':
+                    self._apply_remove(value.id)
+                    self._apply_add(value)
+                else:
+                    self._apply_remove(value)
+    
+    def get_transaction(self, transaction_id: str) -> Optional[Transaction]:
+        """Get a transaction by ID."""
+        self._sync()
+        with self._lock.read():
+            position = self._positions.get(transaction_id)
+            return self._transactions[position] if position is not None else None
+    
+    def get_balance(self) -> float:
+        """Calculate current balance (income - expenses)."""
+        self._sync()
+        with self._lock.read():
+            if self.debug:
+                self.verify_totals()
+            return (self._totals[TransactionType.INCOME] - self._totals[TransactionType.EXPENSE]) / 100
+    
+    def get_total_income(self) -> float:
+        """Calculate total income."""
+        self._sync()
+        with self._lock.read():
+            if self.debug:
+                self.verify_totals()
+            return self._totals[TransactionType.INCOME] / 100
+    
+    def get_total_expenses(self) -> float:
+        """Calculate total expenses."""
+        self._sync()
+        with self._lock.read():
+            if self.debug:
+                self.verify_totals()
+            return self._totals[TransactionType.EXPENSE] / 100
+    
+    def _push_down(self) -> bool:
+        """Whether queries can be answered by the store.
+        
+        Only while it holds every change made here: rows in the write-behind
+        queue or an open batch are in memory only, so the indexes answer.
+        """
+        return self.storage.supports_queries and self._write_behind is None and not self._batch_depth
+    
+    def get_transactions_by_category(self, category: Category) -> List[Transaction]:
+        """Get all transactions for a specific category."""
+        if self._push_down():
+            return self.storage.get_transactions_by_category(category)
+        self._sync()
+        with self._lock.read():
+            return [t for t in self._transactions if t.category == category]
+    
+    def get_transactions_by_date_range(self, start_date: date, end_date: date) -> List[Transaction]:
+        """Get transactions within a date range, oldest first."""
+        if self._push_down():
+            return self.storage.get_transactions_by_date_range(start_date, end_date)
+        self._sync()
+        with self._lock.read():
+            lo = bisect_left(self._date_keys, (start_date.toordinal(),))
+            hi = bisect_left(self._date_keys, (end_date.toordinal() + 1,))
+            return self._by_date[lo:hi]
+    
+    def recent(self, n: int = 10) -> List[Transaction]:
+        """Get the ``n`` most recent transactions, newest first."""
+        if n <= 0:
+            return []
+        self._sync()
+        with self._lock.read():
+            return self._by_date[:-n - 1:-1]
+    
+    @staticmethod
+    def encode_cursor(transaction: Transaction) -> str:
+        """Encode the (date, id) position of a transaction as an opaque page cursor."""
+        key = f"{transaction.date.isoformat()}|{transaction.id}"
+        return base64.urlsafe_b64encode(key.encode('utf-8')).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[int, str]:
+        """Decode a page cursor back into a (date ordinal, id) key.
+        
+        Raises ValueError if the cursor is malformed.
+        """
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            key = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+            date_text, transaction_id = key.split('|', 1)
+            return datetime.strptime(date_text, '%Y-%m-%d').date().toordinal(), transaction_id
+        except (UnicodeError, ValueError) as e:
+            raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+    
+    def page_transactions(self, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+                          category: Optional[Category] = None,
+                          transaction_type: Optional[TransactionType] = None
+                          ) -> Tuple[List[Transaction], Optional[str]]:
+        """Get one page of transactions, newest first, ordered by (date, id).
+        
+        Pass the returned cursor back in to get the following page; it is
+        None once the listing is exhausted. Pages stay stable while rows are
+        added or removed elsewhere in the ledger.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        key = None if cursor is None else self.decode_cursor(cursor)
+        
+        self._sync()
+        page = []
+        with self._lock.read():
+            i = len(self._date_keys) if key is None else bisect_left(self._date_keys, key)
+            while i > 0:
+                i -= 1
+                transaction = self._by_date[i]
+                if category is not None and transaction.category != category:
+                    continue
+                if transaction_type is not None and transaction.transaction_type != transaction_type:
+                    continue
+                if len(page) == limit:
+                    # One more match exists, so there is a next page
+                    return page, self.encode_cursor(page[-1])
+                page.append(transaction)
+        return page, None
+    
+    def get_monthly_summary(self, year: int, month: int) -> Dict:
+        """Get monthly summary for a specific month."""
+        start_date = date(year, month, 1)
+        if month == 12:
+            end_date = date(year + 1, 1, 1) - timedelta(days=1)
+        else:
+            end_date = date(year, month + 1, 1) - timedelta(days=1)
+        
+        if self._push_down():
+            return self.storage.get_monthly_summary(start_date, end_date)
+        
+        self._sync()
+        with self._lock.read():
+            cells = list(self._rollup.get((year, month), {}).items())
+        
+        income = expenses = 0
+        count = 0
+        category_totals = {}
+        for (category, transaction_type), (cents, cell_count) in cells:
+            count += cell_count
+            if transaction_type == TransactionType.INCOME:
+                income += cents
+            else:
+                expenses += cents
+                category_totals[category.value] = cents / 100
+        
+        return {
+            'income': income / 100,
+            'expenses': expenses / 100,
+            'balance': (income - expenses) / 100,
+            'category_totals': category_totals,
+            'transaction_count': count
+        }
+    
+    def get_category_totals(self, transaction_type: TransactionType = TransactionType.EXPENSE) -> Dict[str, float]:
+        """Get all-time totals per category for one transaction type."""
+        category_cents = {}
+        self._sync()
+        with self._lock.read():
+            for cells in self._rollup.values():
+                for (category, cell_type), (cents, _) in cells.items():
+                    if cell_type == transaction_type:
+                        category_cents[category.value] = category_cents.get(category.value, 0) + cents
+        return {category: cents / 100 for category, cents in category_cents.items()}
+    
+    def get_monthly_trend(self, months: int = 6, end_date: Optional[date] = None) -> List[Dict]:
+        """Get income, expenses and balance for the last few months, oldest first."""
+        if end_date is None:
+            end_date = date.today()
+        
+        self._sync()
+        trend = []
+        for i in range(months - 1, -1, -1):
+            month = end_date.month - i
+            year = end_date.year
+            while month <= 0:
+                month += 12
+                year -= 1
+            
+            income = expenses = 0
+            with self._lock.read():
+                cells = list(self._rollup.get((year, month), {}).items())
+            for (_, transaction_type), (cents, _) in cells:
+                if transaction_type == TransactionType.INCOME:
+                    income += cents
+                else:
+                    expenses += cents
+            
+            trend.append({
+                'month': f"{date(year, month, 1).strftime('%B %Y')}",
+                'income': income / 100,
+                'expenses': expenses / 100,
+                'balance': (income - expenses) / 100
+            })
+        return trend
+    
+    def columnar(self) -> ColumnarLedger:
+        """Get a NumPy-backed columnar view of the ledger for bulk analytics.
+        
+        The view is built on first use and reused until the ledger changes.
+        """
+        self._sync()
+        with self._lock.read():
+            if self._columnar is None or self._columnar[0] != self._version:
+                self._columnar = (self._version, ColumnarLedger(self._transactions))
+            return self._columnar[1]
+    
+    def save_data(self) -> None:
+        """Save all transactions to the storage backend.
+        
+        The ledger is copied with the storage lock held, after catching up
+        with other processes, so no one else's writes are lost. A journaled
+        backend keeps the changes committed after the copy, so the snapshot
+        is then written without the lock and other writers only wait for
+        it to be swapped in; other backends hold the lock until it is saved.
+        """
+        with self.storage.lock():
+            self._sync()
+            with self._lock.read():
+                transactions = self._committed_transactions()
+                marker = self.storage.marker()
+            
+            if not self.storage.unlocked_save:
+                with self._own_write():
+                    self.storage.save(transactions, marker)
+                return
+        self.storage.save(transactions, marker)
+    
+    def _committed_transactions(self) -> List[Transaction]:
+        """Copy the ledger without the changes of a batch still open; call with the read lock held.
+        
+        A snapshot taken by the background writer or a compaction while
+        another thread's batch is open must not contain rows that the batch
+        may yet roll back.
+        """
+        if not self._batch_undo:
+            return list(self._transactions)
+        ledger = {t.id: t for t in self._transactions}
+        for op, transaction in reversed(self._batch_undo):
+            if transaction is None:
+                continue
+            if op == 'add':
+                ledger.pop(transaction.id, None)
+            else:
+                ledger[transaction.id] = transaction
+        return list(ledger.values())
+    
+    def compact(self, wait: bool = False) -> None:
+        """Fold the journal into a fresh snapshot.
+        
+        By default the work runs on a background thread; with ``wait`` the
+        snapshot is written before returning.
+        """
+        running = self._compaction_thread is not None and self._compaction_thread.is_alive()
+        if wait:
+            if running:
+                self._compaction_thread.join()
+            self.save_data()
+        elif not running:
+            self._compaction_thread = threading.Thread(target=self.save_data,
+                                                       name="budget-compaction", daemon=True)
+            self._compaction_thread.start()
+    
+    def _persist(self) -> None:
+        """Persist the latest change unless the backend already committed it."""
+        if self._batch_depth or self._write_behind is not None:
+            return
+        if not self.storage.incremental:
+            self.save_data()
+        elif self.storage.needs_compaction():
+            self.compact()
+    
+    def _write_queued(self, changes: List[Tuple[str, object]]) -> None:
+        """Persist one group of queued changes; runs on the write-behind thread."""
+        with self.storage.lock():
+            self._sync()
+            if not self.storage.incremental:
+                self.save_data()
+                return
+            with self._own_write():
+                self.storage.commit(changes)
+            if self.storage.needs_compaction():
+                self.save_data()
+    
+    def flush(self) -> None:
+        """Wait until every change made so far has been written and synced to disk."""
+        if self._write_behind is not None:
+            self._write_behind.flush()
+        self.storage.sync()
+    
+    def close(self) -> None:
+        """Write any queued changes, stop the background writer and sync the store."""
+        if self._write_behind is not None:
+            self._write_behind.close()
+            self._write_behind = None
+        self.storage.sync()
+    
+    def load_data(self) -> None:
+        """Load transactions from the storage backend."""
+        self.transactions = self.storage.load()
+    
+    @staticmethod
+    def _csv_row(transaction: Transaction) -> List:
+        """Convert a transaction to a row in the ``CSV_FIELDNAMES`` layout."""
+        return [
+            transaction.id,
+            transaction.name,
+            transaction.amount,
+            transaction.category.value,
+            transaction.transaction_type.value,
+            transaction.date.isoformat(),
+            transaction.description or '',
+            ', '.join(transaction.tags)
+        ]
+    
+    def iter_csv(self, rows_per_chunk: int = 500) -> Iterator[str]:
+        """Generate the CSV export as text chunks, header first, oldest rows first.
+        
+        Rows are read in (date, id) order one chunk at a time, each chunk
+        under the read lock, so the export can be streamed without building
+        the whole file in memory or holding up writers between chunks.
+        Rows added or removed mid-export behind the current position are
+        not revisited.
+        """
+        import csv
+        import io
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_FIELDNAMES)
+        
+        self._sync()
+        last_key = None
+        while True:
+            with self._lock.read():
+                start = 0 if last_key is None else bisect_right(self._date_keys, last_key)
+                rows = self._by_date[start:start + rows_per_chunk]
+            if not rows:
+                break
+            last_key = self._date_key(rows[-1])
+            
+            for transaction in rows:
+                writer.writerow(self._csv_row(transaction))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        
+        yield buffer.getvalue()
+    
+    def export_to_csv(self, filename: str = "budget_export.csv") -> None:
+        """Export transactions to CSV file."""
+        with open(filename, 'w', newline='') as csvfile:
+            for chunk in self.iter_csv():
+                csvfile.write(chunk)
+    
+    def iter_csv_transactions(self, filename: str) -> Iterator[Tuple[int, Optional[Transaction], Optional[str]]]:
+        """Stream a CSV file in the ``export_to_csv`` layout.
+        
+        Yields ``(line_number, transaction, None)`` for valid rows and
+        ``(line_number, None, error)`` for invalid ones, reading one row at
+        a time. Rows without an ID get a new one.
+        """
+        import csv
+        
+        with open(filename, 'r', newline='') as csvfile:
+            reader = csv.DictReader(csvfile)
+            missing = [name for name in CSV_FIELDNAMES if name not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"CSV file is missing columns: {', '.join(missing)}")
+            
+            for row in reader:
+                try:
+                    name = row['Name'].strip()
+                    if not name:
+                        raise ValueError("Name cannot be empty")
+                    tags = [tag.strip() for tag in row['Tags'].split(',') if tag.strip()]
+                    transaction = self._build_transaction(
+                        name=name,
+                        amount=float(row['Amount']),
+                        category=Category(row['Category']),
+                        transaction_type=TransactionType(row['Type']),
+                        description=row['Description'].strip() or None,
+                        tags=tags,
+                        transaction_date=date.fromisoformat(row['Date'].strip()),
+                        transaction_id=row['ID'].strip() or None
+                    )
+                except (AttributeError, OverflowError, ValueError) as e:
+                    yield reader.line_num, None, str(e)
+                else:
+                    yield reader.line_num, transaction, None
+    
+    def import_csv(self, filename: str, chunk_size: int = 1000,
+                   progress: Optional[Callable[[ImportReport], None]] = None) -> ImportReport:
+        """Import a CSV file in the ``export_to_csv`` layout, one chunk at a time.
+        
+        Valid rows are committed in chunks of ``chunk_size`` with one
+        persistence call each, so memory use does not grow with the file.
+        Invalid rows and IDs already in the ledger are skipped and listed in
+        the report's ``errors``. ``progress`` is called with the report
+        after every chunk.
+        """
+        report = ImportReport()
+        chunk: List[Transaction] = []
+        chunk_ids = set()
+        
+        def commit_chunk():
+            self.add_transactions(chunk)
+            report.imported += len(chunk)
+            report.chunks_committed += 1
+            chunk.clear()
+            chunk_ids.clear()
+            if progress is not None:
+                progress(report)
+        
+        for line_number, transaction, error in self.iter_csv_transactions(filename):
+            report.rows_read += 1
+            if transaction is not None and (transaction.id in self._positions or transaction.id in chunk_ids):
+                error = f"Duplicate transaction ID {transaction.id}"
+            if error is not None:
+                report.errors.append((line_number, error))
+                continue
+            
+            chunk.append(transaction)
+            chunk_ids.add(transaction.id)
+            if len(chunk) >= chunk_size:
+                commit_chunk()
+        
+        if chunk:
+            commit_chunk()
+        return report
+
+
+def gzip_stream(chunks: Iterable[str], encoding: str = 'utf-8') -> Iterator[bytes]:
+    """Compress a stream of text chunks into a gzip byte stream, chunk by chunk."""
+    import zlib
+    
+    compressor = zlib.compressobj(wbits=31)  # 31 selects the gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode(encoding))
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,123 @@
+"""
+Write-behind queue: persists ledger changes on a background thread,
+grouping everything that arrives within a short window into one write.
+"""
+
+import atexit
+import threading
+import time
+import weakref
+from typing import Callable, List, Optional, Tuple
+
+# Queues still open at interpreter exit are flushed so no change is lost
+_OPEN_QUEUES = weakref.WeakSet()
+
+
+class WriteBehindQueue:
+    """Background writer that persists queued changes in groups.
+    
+    Changes handed to ``put`` stay pending until the writer thread passes
+    them to ``write``. The first pending change is written at most
+    ``max_delay`` seconds after it arrived, together with every change
+    queued in the meantime (group commit). If a write fails, the changes
+    stay pending and are retried.
+    """
+    
+    def __init__(self, write: Callable[[List[Tuple[str, object]]], None], max_delay: float = 0.05):
+        """Start the writer thread; ``write`` persists one group of changes."""
+        self.max_delay = max_delay
+        self._write = write
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[str, object]] = []
+        self._queued = 0
+        self._written = 0
+        self._flushing = 0
+        self._failures = 0
+        self._last_error: Optional[Exception] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="budget-write-behind", daemon=True)
+        self._thread.start()
+        _OPEN_QUEUES.add(self)
+    
+    def put(self, changes: List[Tuple[str, object]]) -> None:
+        """Queue changes for the writer thread."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("The write-behind queue is closed")
+            self._pending.extend(changes)
+            self._queued += len(changes)
+            self._cond.notify_all()
+    
+    def pending(self) -> List[Tuple[str, object]]:
+        """Return the changes queued but not yet written, oldest first."""
+        with self._cond:
+            return list(self._pending)
+    
+    def flush(self) -> None:
+        """Block until every change queued so far has been written.
+        
+        Raises RuntimeError if a write fails in the meantime; the changes
+        stay queued and the writer keeps retrying.
+        """
+        with self._cond:
+            target = self._queued
+            failures = self._failures
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                while self._written < target and self._thread.is_alive():
+                    if self._failures != failures:
+                        raise RuntimeError(f"Queued changes could not be written: {self._last_error}")
+                    self._cond.wait()
+            finally:
+                self._flushing -= 1
+    
+    def close(self) -> None:
+        """Write the remaining changes and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        _OPEN_QUEUES.discard(self)
+    
+    def _run(self) -> None:
+        """Writer thread: wait for changes, let a group gather, write it."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                
+                deadline = time.monotonic() + self.max_delay
+                while not self._closed and not self._flushing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                group = list(self._pending)
+            
+            try:
+                self._write(group)
+            except Exception as e:
+                print(f"Error writing queued changes: {e}")
+                with self._cond:
+                    self._failures += 1
+                    self._last_error = e
+                    self._cond.notify_all()
+                    if self._closed:
+                        return
+                    self._cond.wait(self.max_delay)
+                continue
+            
+            with self._cond:
+                del self._pending[:len(group)]
+                self._written += len(group)
+                self._cond.notify_all()
+
+
+@atexit.register
+def _close_open_queues() -> None:
+    """Flush and stop every write-behind queue still open at exit."""
+    for queue in list(_OPEN_QUEUES):
+        queue.close()
@@ -6,10 +6,10 @@ This script demonstrates the core functionality with sample data.
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import the classes from the main budget tracker file
-exec(open('budget-tracker.py').read())
+# Import the budget tracker classes
+from budget_tracker import BudgetTracker, Category, TransactionType
 
 from datetime import date, timedelta
 
@@ -25,70 +25,72 @@ def run_demo():
     # Add sample transactions
     print("\n📝 Adding sample transactions...")
     
-    # Income transactions
-    tracker.add_transaction(
-        name="Monthly Salary",
-        amount=5000.00,
-        category=Category.SALARY,
-        transaction_type=TransactionType.INCOME,
-        description="Regular monthly salary payment",
-        tags=["salary", "monthly"]
-    )
-    
-    tracker.add_transaction(
-        name="Freelance Project",
-        amount=1200.00,
-        category=Category.FREELANCE,
-        transaction_type=TransactionType.INCOME,
-        description="Web development project",
-        tags=["freelance", "web-dev"]
-    )
-    
-    # Expense transactions
-    tracker.add_transaction(
-        name="Grocery Shopping",
-        amount=150.00,
-        category=Category.FOOD,
-        transaction_type=TransactionType.EXPENSE,
-        description="Weekly groceries",
-        tags=["groceries", "weekly"]
-    )
-    
-    tracker.add_transaction(
-        name="Gas Station",
-        amount=45.00,
-        category=Category.TRANSPORTATION,
-        transaction_type=TransactionType.EXPENSE,
-        description="Fuel for car",
-        tags=["gas", "transport"]
-    )
-    
-    tracker.add_transaction(
-        name="Netflix Subscription",
-        amount=15.99,
-        category=Category.ENTERTAINMENT,
-        transaction_type=TransactionType.EXPENSE,
-        description="Monthly streaming service",
-        tags=["entertainment", "subscription"]
-    )
-    
-    tracker.add_transaction(
-        name="Electric Bill",
-        amount=89.50,
-        category=Category.UTILITIES,
-        transaction_type=TransactionType.EXPENSE,
-        description="Monthly electricity bill",
-        tags=["utilities", "monthly"]
-    )
-    
-    tracker.add_transaction(
-        name="Restaurant Dinner",
-        amount=65.00,
-        category=Category.FOOD,
-        transaction_type=TransactionType.EXPENSE,
-        description="Dinner with friends",
-        tags=["dining", "social"]
-    )
+    # Persist all sample transactions with a single write
+    with tracker.batch():
+        # Income transactions
+        tracker.add_transaction(
+            name="Monthly Salary",
+            amount=5000.00,
+            category=Category.SALARY,
+            transaction_type=TransactionType.INCOME,
+            description="Regular monthly salary payment",
+            tags=["salary", "monthly"]
+        )
+        
+        tracker.add_transaction(
+            name="Freelance Project",
+            amount=1200.00,
+            category=Category.FREELANCE,
+            transaction_type=TransactionType.INCOME,
+            description="Web development project",
+            tags=["freelance", "web-dev"]
+        )
+        
+        # Expense transactions
+        tracker.add_transaction(
+            name="Grocery Shopping",
+            amount=150.00,
+            category=Category.FOOD,
+            transaction_type=TransactionType.EXPENSE,
+            description="Weekly groceries",
+            tags=["groceries", "weekly"]
+        )
+        
+        tracker.add_transaction(
+            name="Gas Station",
+            amount=45.00,
+            category=Category.TRANSPORTATION,
+            transaction_type=TransactionType.EXPENSE,
+            description="Fuel for car",
+            tags=["gas", "transport"]
+        )
+        
+        tracker.add_transaction(
+            name="Netflix Subscription",
+            amount=15.99,
+            category=Category.ENTERTAINMENT,
+            transaction_type=TransactionType.EXPENSE,
+            description="Monthly streaming service",
+            tags=["entertainment", "subscription"]
+        )
+        
+        tracker.add_transaction(
+            name="Electric Bill",
+            amount=89.50,
+            category=Category.UTILITIES,
+            transaction_type=TransactionType.EXPENSE,
+            description="Monthly electricity bill",
+            tags=["utilities", "monthly"]
+        )
+        
+        tracker.add_transaction(
+            name="Restaurant Dinner",
+            amount=65.00,
+            category=Category.FOOD,
+            transaction_type=TransactionType.EXPENSE,
+            description="Dinner with friends",
+            tags=["dining", "social"]
+        )
     
     print("✅ Sample transactions added successfully!")
     
@@ -24,7 +24,7 @@ setup(
     long_description=read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/professional-budget-tracker",
-    py_modules=["budget_tracker"],
+    packages=find_packages(include=["budget_tracker", "budget_tracker.*"]),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: End Users/Desktop",
@@ -42,7 +42,7 @@ setup(
     install_requires=read_requirements(),
     entry_points={
         "console_scripts": [
-            "budget-tracker=budget_tracker:main",
+            "budget-tracker=budget_tracker.cli:main",
         ],
     },
     keywords="budget, finance, personal, money, tracking, cli",
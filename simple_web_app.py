@@ -4,7 +4,8 @@ Professional Budget Tracker - Simple Web Application
 A fully functional web interface using inline templates.
 """
 
-from flask import Flask, render_template_string, request, redirect, url_for, flash
+from flask import Flask, render_template, request, redirect, url_for, flash
+from jinja2 import DictLoader
 import json
 from datetime import date, datetime, timedelta
 import locale
@@ -13,10 +14,10 @@ import sys
 import os
 
 # Add the current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import the budget tracker classes by executing the main file
-exec(open('budget-tracker.py').read())
+# Import the budget tracker classes
+from budget_tracker import BudgetTracker, Category, TransactionType, DEFAULT_PAGE_SIZE
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-change-this-in-production'
@@ -298,70 +299,7 @@ DASHBOARD_TEMPLATE = BASE_TEMPLATE.replace('{% block content %}{% endblock %}',
     </script>
 ''')
 
-@app.route('/')
-def index():
-    """Main dashboard page."""
-    # Get summary data
-    total_income = tracker.get_total_income()
-    total_expenses = tracker.get_total_expenses()
-    balance = tracker.get_balance()
-    
-    # Get recent transactions (last 10)
-    recent_transactions = sorted(tracker.transactions, key=lambda x: x.date, reverse=True)[:10]
-    
-    # Get monthly summary for current month
-    current_date = date.today()
-    monthly_summary = tracker.get_monthly_summary(current_date.year, current_date.month)
-    
-    # Get category breakdown for expenses
-    category_totals = {}
-    for transaction in tracker.transactions:
-        if transaction.transaction_type == TransactionType.EXPENSE:
-            category = transaction.category.value
-            category_totals[category] = category_totals.get(category, 0) + transaction.amount
-    
-    # Sort categories by amount
-    sorted_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
-    
-    return render_template_string(DASHBOARD_TEMPLATE,
-                                title="Dashboard",
-                                total_income=total_income,
-                                total_expenses=total_expenses,
-                                balance=balance,
-                                recent_transactions=recent_transactions,
-                                monthly_summary=monthly_summary,
-                                category_totals=sorted_categories,
-                                format_currency=format_currency)
-
-@app.route('/transactions')
-def transactions():
-    """Transactions page."""
-    # Get filter parameters
-    category_filter = request.args.get('category', '')
-    type_filter = request.args.get('type', '')
-    
-    # Filter transactions
-    filtered_transactions = tracker.transactions
-    
-    if category_filter:
-        try:
-            category = Category(category_filter)
-            filtered_transactions = [t for t in filtered_transactions if t.category == category]
-        except ValueError:
-            pass
-    
-    if type_filter:
-        try:
-            transaction_type = TransactionType(type_filter)
-            filtered_transactions = [t for t in filtered_transactions if t.transaction_type == transaction_type]
-        except ValueError:
-            pass
-    
-    # Sort by date (newest first)
-    filtered_transactions = sorted(filtered_transactions, key=lambda x: x.date, reverse=True)
-    
-    # Create transactions template
-    transactions_template = BASE_TEMPLATE.replace('{% block content %}{% endblock %}', '''
+TRANSACTIONS_TEMPLATE = BASE_TEMPLATE.replace('{% block content %}{% endblock %}', '''
         <!-- Page Header -->
         <div class="row mb-4">
             <div class="col-12">
@@ -438,6 +376,22 @@ def transactions():
                                     </tbody>
                                 </table>
                             </div>
+                            {% if request.args.get('cursor') or next_cursor %}
+                                <nav class="d-flex justify-content-between mt-3" aria-label="Transaction pages">
+                                    {% if request.args.get('cursor') %}
+                                        <a href="{{ url_for('transactions', category=request.args.get('category') or None, type=request.args.get('type') or None, limit=request.args.get('limit')) }}" class="btn btn-outline-secondary">
+                                            <i class="fas fa-angle-double-left me-1"></i>Newest
+                                        </a>
+                                    {% else %}
+                                        <span></span>
+                                    {% endif %}
+                                    {% if next_cursor %}
+                                        <a href="{{ url_for('transactions', category=request.args.get('category') or None, type=request.args.get('type') or None, limit=request.args.get('limit'), cursor=next_cursor) }}" class="btn btn-outline-primary">
+                                            Older<i class="fas fa-angle-right ms-1"></i>
+                                        </a>
+                                    {% endif %}
+                                </nav>
+                            {% endif %}
                         {% else %}
                             <div class="text-center py-5">
                                 <i class="fas fa-inbox fa-4x text-muted mb-4"></i>
@@ -452,55 +406,9 @@ def transactions():
                 </div>
             </div>
         </div>
-    ''')
-    
-    return render_template_string(transactions_template,
-                                title="Transactions",
-                                transactions=filtered_transactions,
-                                format_currency=format_currency)
+''')
 
-@app.route('/add_transaction', methods=['GET', 'POST'])
-def add_transaction():
-    """Add transaction page."""
-    if request.method == 'POST':
-        try:
-            # Get form data
-            name = request.form['name'].strip()
-            amount = float(request.form['amount'])
-            category = Category(request.form['category'])
-            transaction_type = TransactionType(request.form['transaction_type'])
-            description = request.form.get('description', '').strip() or None
-            tags_input = request.form.get('tags', '').strip()
-            tags = [tag.strip() for tag in tags_input.split(',')] if tags_input else []
-            
-            # Validate
-            if not name:
-                flash('Transaction name is required', 'error')
-                return redirect(url_for('add_transaction'))
-            
-            if amount <= 0:
-                flash('Amount must be positive', 'error')
-                return redirect(url_for('add_transaction'))
-            
-            # Add transaction
-            transaction = tracker.add_transaction(
-                name=name,
-                amount=amount,
-                category=category,
-                transaction_type=transaction_type,
-                description=description,
-                tags=tags
-            )
-            
-            flash(f'Transaction "{name}" added successfully!', 'success')
-            return redirect(url_for('transactions'))
-            
-        except (ValueError, KeyError) as e:
-            flash(f'Error adding transaction: {str(e)}', 'error')
-            return redirect(url_for('add_transaction'))
-    
-    # Create add transaction template
-    add_template = BASE_TEMPLATE.replace('{% block content %}{% endblock %}', '''
+ADD_TEMPLATE = BASE_TEMPLATE.replace('{% block content %}{% endblock %}', '''
         <!-- Page Header -->
         <div class="row mb-4">
             <div class="col-12">
@@ -628,36 +536,9 @@ def add_transaction():
                 </div>
             </div>
         </div>
-    ''')
-    
-    return render_template_string(add_template, title="Add Transaction")
-
-@app.route('/delete_transaction/<transaction_id>', methods=['POST'])
-def delete_transaction(transaction_id):
-    """Delete a transaction."""
-    if tracker.remove_transaction(transaction_id):
-        flash('Transaction deleted successfully!', 'success')
-    else:
-        flash('Transaction not found!', 'error')
-    
-    return redirect(url_for('transactions'))
+''')
 
-@app.route('/reports')
-def reports():
-    """Reports page - simplified version."""
-    # Get current month summary
-    current_date = date.today()
-    monthly_summary = tracker.get_monthly_summary(current_date.year, current_date.month)
-    
-    # Get category breakdown
-    category_totals = {}
-    for transaction in tracker.transactions:
-        if transaction.transaction_type == TransactionType.EXPENSE:
-            category = transaction.category.value
-            category_totals[category] = category_totals.get(category, 0) + transaction.amount
-    
-    # Create simple reports template
-    reports_template = BASE_TEMPLATE.replace('{% block content %}{% endblock %}', '''
+REPORTS_TEMPLATE = BASE_TEMPLATE.replace('{% block content %}{% endblock %}', '''
         <!-- Page Header -->
         <div class="row mb-4">
             <div class="col-12">
@@ -755,9 +636,146 @@ def reports():
                 </div>
             </div>
         </div>
-    ''')
+''')
+
+# Register the pages with Jinja once so each is compiled on first use and cached
+app.jinja_loader = DictLoader({
+    'dashboard.html': DASHBOARD_TEMPLATE,
+    'transactions.html': TRANSACTIONS_TEMPLATE,
+    'add.html': ADD_TEMPLATE,
+    'reports.html': REPORTS_TEMPLATE
+})
+
+@app.route('/')
+def index():
+    """Main dashboard page."""
+    # Get summary data
+    total_income = tracker.get_total_income()
+    total_expenses = tracker.get_total_expenses()
+    balance = tracker.get_balance()
+    
+    # Get recent transactions (last 10)
+    recent_transactions = tracker.recent(10)
+    
+    # Get monthly summary for current month
+    current_date = date.today()
+    monthly_summary = tracker.get_monthly_summary(current_date.year, current_date.month)
+    
+    # Get category breakdown for expenses
+    category_totals = tracker.get_category_totals(TransactionType.EXPENSE)
+    
+    # Sort categories by amount
+    sorted_categories = sorted(category_totals.items(), key=lambda x: x[1], reverse=True)
+    
+    return render_template('dashboard.html',
+                                title="Dashboard",
+                                total_income=total_income,
+                                total_expenses=total_expenses,
+                                balance=balance,
+                                recent_transactions=recent_transactions,
+                                monthly_summary=monthly_summary,
+                                category_totals=sorted_categories,
+                                format_currency=format_currency)
+
+@app.route('/transactions')
+def transactions():
+    """Transactions page, one page at a time (newest first)."""
+    # Get filter and paging parameters
+    category_filter = request.args.get('category', '')
+    type_filter = request.args.get('type', '')
+    cursor = request.args.get('cursor') or None
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    
+    category = None
+    if category_filter:
+        try:
+            category = Category(category_filter)
+        except ValueError:
+            pass
+    
+    transaction_type = None
+    if type_filter:
+        try:
+            transaction_type = TransactionType(type_filter)
+        except ValueError:
+            pass
+    
+    try:
+        page, next_cursor = tracker.page_transactions(cursor, limit, category, transaction_type)
+    except ValueError:
+        # Malformed cursor: fall back to the newest page
+        page, next_cursor = tracker.page_transactions(None, limit, category, transaction_type)
+    
+    return render_template('transactions.html',
+                                title="Transactions",
+                                transactions=page,
+                                next_cursor=next_cursor,
+                                format_currency=format_currency)
+
+@app.route('/add_transaction', methods=['GET', 'POST'])
+def add_transaction():
+    """Add transaction page."""
+    if request.method == 'POST':
+        try:
+            # Get form data
+            name = request.form['name'].strip()
+            amount = float(request.form['amount'])
+            category = Category(request.form['category'])
+            transaction_type = TransactionType(request.form['transaction_type'])
+            description = request.form.get('description', '').strip() or None
+            tags_input = request.form.get('tags', '').strip()
+            tags = [tag.strip() for tag in tags_input.split(',')] if tags_input else []
+            
+            # Validate
+            if not name:
+                flash('Transaction name is required', 'error')
+                return redirect(url_for('add_transaction'))
+            
+            if amount <= 0:
+                flash('Amount must be positive', 'error')
+                return redirect(url_for('add_transaction'))
+            
+            # Add transaction
+            transaction = tracker.add_transaction(
+                name=name,
+                amount=amount,
+                category=category,
+                transaction_type=transaction_type,
+                description=description,
+                tags=tags
+            )
+            
+            flash(f'Transaction "{name}" added successfully!', 'success')
+            return redirect(url_for('transactions'))
+            
+        except (ValueError, KeyError) as e:
+            flash(f'Error adding transaction: {str(e)}', 'error')
+            return redirect(url_for('add_transaction'))
+    
+    return render_template('add.html', title="Add Transaction")
+
+@app.route('/delete_transaction/<transaction_id>', methods=['POST'])
+def delete_transaction(transaction_id):
+    """Delete a transaction."""
+    if tracker.remove_transaction(transaction_id):
+        flash('Transaction deleted successfully!', 'success')
+    else:
+        flash('Transaction not found!', 'error')
+    
+    return redirect(url_for('transactions'))
+
+@app.route('/reports')
+def reports():
+    """Reports page - simplified version."""
+    # Get current month summary
+    current_date = date.today()
+    monthly_summary = tracker.get_monthly_summary(current_date.year, current_date.month)
+    
+    # Get category breakdown, largest first
+    category_totals = sorted(tracker.get_category_totals(TransactionType.EXPENSE).items(),
+                             key=lambda x: x[1], reverse=True)
     
-    return render_template_string(reports_template,
+    return render_template('reports.html',
                                 title="Reports",
                                 monthly_summary=monthly_summary,
                                 category_totals=category_totals,
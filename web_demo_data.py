@@ -9,10 +9,10 @@ import os
 from datetime import date, timedelta
 
 # Add the current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import the budget tracker classes
-exec(open('budget-tracker.py').read())
+from budget_tracker import BudgetTracker, Category, TransactionType
 
 def add_demo_data():
     """Add sample transactions to demonstrate the web interface."""
@@ -48,34 +48,33 @@ def add_demo_data():
         ("Home Depot", 89.99, Category.SHOPPING, "Home improvement supplies"),
     ]
     
-    # Add income transactions (spread over the last 3 months)
-    for i, (name, amount, category, description) in enumerate(income_transactions):
-        transaction_date = date.today() - timedelta(days=30 * (i % 3))
-        tracker.add_transaction(
-            name=name,
-            amount=amount,
-            category=category,
-            transaction_type=TransactionType.INCOME,
-            description=description,
-            tags=["income", "monthly"] if category == Category.SALARY else ["income"],
-            transaction_date=transaction_date
-        )
-    
-    # Add expense transactions (spread over the last 2 months)
-    for i, (name, amount, category, description) in enumerate(expense_transactions):
-        transaction_date = date.today() - timedelta(days=15 * (i % 4))
-        tracker.add_transaction(
-            name=name,
-            amount=amount,
-            category=category,
-            transaction_type=TransactionType.EXPENSE,
-            description=description,
-            tags=["essential"] if category in [Category.HOUSING, Category.UTILITIES, Category.FOOD] else ["discretionary"],
-            transaction_date=transaction_date
-        )
-    
-    # Save the data
-    tracker.save_data()
+    # Apply all sample transactions in one batch instead of one write per row
+    with tracker.batch():
+        # Add income transactions (spread over the last 3 months)
+        for i, (name, amount, category, description) in enumerate(income_transactions):
+            transaction_date = date.today() - timedelta(days=30 * (i % 3))
+            tracker.add_transaction(
+                name=name,
+                amount=amount,
+                category=category,
+                transaction_type=TransactionType.INCOME,
+                description=description,
+                tags=["income", "monthly"] if category == Category.SALARY else ["income"],
+                transaction_date=transaction_date
+            )
+        
+        # Add expense transactions (spread over the last 2 months)
+        for i, (name, amount, category, description) in enumerate(expense_transactions):
+            transaction_date = date.today() - timedelta(days=15 * (i % 4))
+            tracker.add_transaction(
+                name=name,
+                amount=amount,
+                category=category,
+                transaction_type=TransactionType.EXPENSE,
+                description=description,
+                tags=["essential"] if category in [Category.HOUSING, Category.UTILITIES, Category.FOOD] else ["discretionary"],
+                transaction_date=transaction_date
+            )
     
     print("✅ Demo data added successfully!")
     print(f"📊 Total transactions: {len(tracker.transactions)}")